@@ -4,7 +4,7 @@ from typing import Dict, List
 
 from src.consts.env import BASE_PATH
 from src.core.GlobalClass import GlobalClass
-from src.types.configTypes import ExtendedConfigType, ConfigSection
+from src.types.configTypes import ExtendedConfigType, ConfigSection, ConfigRecord
 
 
 class JsonConfigManager(GlobalClass):
@@ -36,6 +36,12 @@ class JsonConfigManager(GlobalClass):
         with open(self.json_file, "r", encoding="utf-8") as f:
             data = json.load(f)
             self.sections_data = data.get("sections", {})
+
+        # Convierte cada configuración de las secciones a ConfigRecord una sola vez
+        for section in self.sections_data.values():
+            section["configs"] = [
+                ConfigRecord.from_dict(row) for row in section.get("configs", [])
+            ]
             
         if not self.sections_data:
             self.colors.error("No se encontraron secciones en el archivo de configuración")
@@ -103,14 +109,14 @@ class JsonConfigManager(GlobalClass):
         
         for idx, config in enumerate(configs, 1):
             # Obtener project: primero de la config, si no existe, de la sección
-            project_display = config.get('project') or section.get('project')
+            project_display = config.project or section.get('project')
             
             self.colors.info(
-                f"{idx}. {config.get('name')}"
+                f"{idx}. {config.name}"
             )
             self.colors.info(f"   Proyecto: {project_display}")
-            self.colors.info(f"   Base: {config.get('base_branch')}")
-            self.colors.info(f"   Feature: {config.get('feature_branch')}")
+            self.colors.info(f"   Base: {config.base_branch}")
+            self.colors.info(f"   Feature: {config.feature_branch}")
             self.colors.info("")
 
     def select_config_from_section(self, section_key: str) -> ExtendedConfigType:
@@ -150,7 +156,7 @@ class JsonConfigManager(GlobalClass):
                 self.colors.info("\n\nOperación cancelada.")
                 sys.exit(0)
 
-    def _prepare_config(self, config: Dict, section_key: str, config_number: int) -> ExtendedConfigType:
+    def _prepare_config(self, config: ConfigRecord, section_key: str, config_number: int) -> ExtendedConfigType:
         """
         Prepara la configuración con la ruta completa y metadata adicional
         
@@ -167,14 +173,14 @@ class JsonConfigManager(GlobalClass):
         section = self.sections_data[section_key]
         
         # Obtener repo_path: primero de la config, si no existe, de la sección
-        repo_value = config.get("repo_path") or section.get("repo_path")
+        repo_value = config.repo_path or section.get("repo_path")
         if not repo_value:
             self.colors.error("No se encontró 'repo_path' ni en la configuración ni en la sección.")
             sys.exit(1)
         
         # Obtener project: primero de la config, si no existe, de la sección
-        project_value = config.get("project") or section.get("project")        
-        name_folder = config.get("name_folder") or section.get("name_folder")     
+        project_value = config.project or section.get("project")
+        name_folder = config.name_folder or section.get("name_folder")
         section_description = section.get("description", section_key)
         
         # Construir la ruta completa del repositorio
@@ -191,20 +197,28 @@ class JsonConfigManager(GlobalClass):
         full_repo_path = full_repo_path.replace("\\", "/")
         
         # Crear configuración con tipo correcto
-        config_with_path = {
-            **config,
-            "number": config_number,
-            "repo_path": full_repo_path,
-            "project": project_value or "N/A",
-            "section": section_description,
-        }
-        
-        self.view_selected_config(config_with_path)  # type: ignore
+        config_with_path = ExtendedConfigType(
+            number=config_number,
+            id=config.id,
+            name=config.name,
+            email=config.email,
+            username=config.username,
+            token=config.token,
+            branch=config.branch,
+            repo_path=full_repo_path,
+            base_branch=config.base_branch,
+            feature_branch=config.feature_branch,
+            project=project_value or "N/A",
+            section=section_description,
+            task=config.task,
+        )
+        
+        self.view_selected_config(config_with_path)
         
         if not self.confirm_action("¿La configuración seleccionada es correcta?"):
             sys.exit(1)
         
-        return config_with_path  # type: ignore
+        return config_with_path
 
     def get_full_config_flow(self) -> ExtendedConfigType:
         """
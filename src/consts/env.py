@@ -13,5 +13,8 @@ BASE_PATH = os.getenv("BASE_PATH", "C:/")
 # Pass para acciones sensibles
 PASS_SENSITIVE = os.getenv("PASS_SENSITIVE", "1234")
 
+# Segundos durante los que no se vuelve a pedir el pass tras verificarlo (0 = siempre)
+PASS_TTL = float(os.getenv("PASS_TTL", "0"))
+
 # ID Para conaqyt
 GIT_CONFIG_ID = os.getenv("GIT_CONFIG_ID")
@@ -1,10 +1,14 @@
 import os
 import sys
-from typing import List, Optional
+import time
+from typing import List, Optional, TYPE_CHECKING
 
-from src.consts.env import PASS_SENSITIVE
+from src.consts.env import PASS_SENSITIVE, PASS_TTL
 from src.utils.ConsoleColors import ConsoleColors
-from src.types.configTypes import MenuOptionType, ExtendedConfigType, LoggerProtocol
+from src.types.configTypes import MenuOption, ExtendedConfigType
+
+if TYPE_CHECKING:
+    from src.types.configTypes import LoggerProtocol
 
 
 # Clase abstracta para manejar las configuraciones globales
@@ -20,6 +24,8 @@ class GlobalClass:
         self.colors = ConsoleColors()
         # Inicializa config como None por defecto
         self.config  = selected_config
+        # Momento de la última verificación correcta del pass (time.monotonic)
+        self.pass_verified_at: Optional[float] = None
 
     # Función para imprimir la configuración seleccionada
     def view_selected_config(self, config: "ExtendedConfigType") -> None:
@@ -29,15 +35,15 @@ class GlobalClass:
         """
         self.colors.info("--------------------------------")
         self.colors.info(
-            f"👉 Configuración seleccionada: {config.get('name')}"
+            f"👉 Configuración seleccionada: {config.name}"
         )
-        self.colors.info(f"👉 Número: {config.get('number')}")
-        self.colors.info(f"👉 Repo: {config.get('repo_path')}")
-        self.colors.info(f"👉 Rama base: {config.get('base_branch')}")
-        self.colors.info(f"👉 Rama feature: {config.get('feature_branch')}\n")
-        self.colors.info(f"👉 Proyecto: {config.get('project')}")
-        self.colors.info(f"👉 Sección: {config.get('section')}")
-        self.colors.info(f"👉 Tarea: {config.get('task')}")
+        self.colors.info(f"👉 Número: {config.number}")
+        self.colors.info(f"👉 Repo: {config.repo_path}")
+        self.colors.info(f"👉 Rama base: {config.base_branch}")
+        self.colors.info(f"👉 Rama feature: {config.feature_branch}\n")
+        self.colors.info(f"👉 Proyecto: {config.project}")
+        self.colors.info(f"👉 Sección: {config.section}")
+        self.colors.info(f"👉 Tarea: {config.task}")
         self.colors.info("--------------------------------")
         self.colors.info("\n")
 
@@ -71,8 +77,16 @@ class GlobalClass:
     # Función para pedir la contraseña para acciones sensibles
     def ask_pass(self, message: str = "Escribe la contraseña: ") -> None:
         """
-        Pide el pass para acciones sensibles
+        Pide el pass para acciones sensibles, salvo que se haya verificado
+        hace menos de PASS_TTL segundos
         """
+        if (
+            PASS_TTL > 0
+            and self.pass_verified_at is not None
+            and time.monotonic() - self.pass_verified_at < PASS_TTL
+        ):
+            return
+
         pass_input = input(f"📝 {message}").strip()
         
         # Registra que se pidió contraseña (sin mostrar la contraseña)
@@ -87,6 +101,7 @@ class GlobalClass:
                 self.logger.log_program_end()
             sys.exit(1)
         else:
+            self.pass_verified_at = time.monotonic()
             if hasattr(self, 'logger') and self.logger is not None:
                 self.logger.log_success("Contraseña verificada correctamente", "ask_pass")
 
@@ -100,7 +115,7 @@ class GlobalClass:
         # Verifica si faltan campos en la configuración seleccionada
         for field in fields:
             # Obtiene el valor del campo
-            value = self.config.get(field) if isinstance(self.config, dict) else None
+            value = getattr(self.config, field, None)
             # Verifica si el campo esta vació
             if not value:
                 self.colors.error(f"Falta el campo '{field}' en la configuración.")
@@ -111,28 +126,39 @@ class GlobalClass:
             sys.exit(1)
         self.colors.success("Todos los campos requeridos son validos.")
 
+    # Función que se ejecuta antes de cada opción del menú (las clases hijas la sobrescriben)
+    def before_menu_action(self) -> None:
+        """
+        Prepara el estado antes de ejecutar una opción del menú
+        """
+
     # Función abstracta para mostrar el menu de opciones
-    def show_menu(self, options: List["MenuOptionType"], is_submenu: bool = False) -> None:
+    def show_menu(self, options: List["MenuOption"], is_submenu: bool = False) -> None:
         """
         Muestra el menu de opciones
-        @param {List[MenuOptionType]} options: Las opciones del menu [{ function: callable, description: str }]
+        @param {List[MenuOption]} options: Las opciones del menu MenuOption(function, description)
         @param {bool} is_submenu: Si es True, muestra 'Volver' en lugar de 'Salir'
         """
         # Validar que las opciones tengan la estructura correcta
         for option in options:
-            if 'function' not in option or 'description' not in option:
-                self.colors.error("Formato de opciones inválido. Cada opción debe tener 'function' y 'description'.")
+            if not isinstance(option, MenuOption):
+                self.colors.error("Formato de opciones inválido. Cada opción debe ser un MenuOption(function, description).")
                 return
 
+        # Funciones y descripciones en tuplas paralelas, se indexan por número de opción
+        menu_functions = tuple(option.function for option in options)
+        menu_descriptions = tuple(option.description for option in options)
+        exit_number = str(len(options) + 1)
+
         # Bucle para mostrar el menu de opciones
         while True:
             # Mostrar el menu de opciones
             self.colors.info("--------------------------------")
             self.colors.info("🔄 MENU DE OPCIONES PARA GIT:" if not is_submenu else "🔄 SUBMENÚ DE OPCIONES:")
-            for index, option in enumerate(options, start=1):
-                self.colors.info(f"[{index}] {option.get('description')}")
+            for index, description in enumerate(menu_descriptions, start=1):
+                self.colors.info(f"[{index}] {description}")
             exit_text = "🔙 Volver" if is_submenu else "❌ Salir"
-            self.colors.info(f"[{len(options) + 1}] {exit_text}")
+            self.colors.info(f"[{exit_number}] {exit_text}")
             self.colors.info("--------------------------------\n")
 
             # Pedir la opción seleccionada
@@ -141,7 +167,7 @@ class GlobalClass:
             ).strip()
 
             # Verificar si el usuario quiere salir o volver
-            if selected == str(len(options) + 1):
+            if selected == exit_number:
                 if is_submenu:
                     self.colors.info("🔙 Volviendo al menú anterior...")
                     return
@@ -155,13 +181,15 @@ class GlobalClass:
             # Verificar si la opción es válida y ejecutar la función correspondiente
             try:
                 selected_index = int(selected) - 1
-                if 0 <= selected_index < len(options):
+                if 0 <= selected_index < len(menu_functions):
                     # Registra la selección del menú
                     if hasattr(self, 'logger') and self.logger is not None:
-                        option_description = options[selected_index]['description']
-                        self.logger.log_menu_selection(selected_index + 1, option_description)
+                        self.logger.log_menu_selection(
+                            selected_index + 1, menu_descriptions[selected_index]
+                        )
                     
-                    options[selected_index]['function']()
+                    self.before_menu_action()
+                    menu_functions[selected_index]()
                 else:
                     self.colors.error("Opción no válida.")
                     if hasattr(self, 'logger') and self.logger is not None:
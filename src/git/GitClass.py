@@ -1,10 +1,22 @@
+import atexit
+import os
+import shlex
 import subprocess
 import sys
+import time
 from colorama import Fore
-from typing import Optional, List
+from typing import Callable, Optional, List, Dict, FrozenSet, Set, Tuple, Union
+
+# pygit2 es opcional: si está instalado, las consultas de solo lectura se
+# resuelven en el mismo proceso en lugar de lanzar git
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
 
 from src.core.GlobalClass import GlobalClass
 from src.git.GitLogClass import GitLogClass
+from src.git.GitQueueLogClass import GitQueueLogClass
 from src.utils.ExceptionsClass import RestartProgramException
 from src.git.managers.GitBranchManager import GitBranchManager
 from src.git.managers.GitStashManager import GitStashManager
@@ -14,12 +26,50 @@ from src.git.managers.GitRebaseManager import GitRebaseManager
 from src.git.managers.GitResetManager import GitResetManager
 from src.git.managers.GitWorkflowManager import GitWorkflowManager
 from src.git.managers.GitAbortManager import GitAbortManager
-from src.types.configTypes import ExtendedConfigType, GitCommandResult, MenuOptionType
+from src.types.configTypes import (
+    BranchStatusType,
+    ExtendedConfigType,
+    GitCommandResult,
+    MenuOption,
+    StatusEntryType,
+)
 
 
 class GitClass(GlobalClass):
     """Clase para manejar operaciones Git de forma interactiva y segura"""
 
+    # Segundos durante los que un fetch se considera reciente
+    FETCH_FRESHNESS_SECONDS: float = 60.0
+    # Línea que se imprime entre los comandos de un lote (run_git_batch)
+    BATCH_SEPARATOR: str = "__GIT_BATCH_SEPARATOR__"
+    # Subcomandos que modifican cada caché (ver _after_command)
+    REMOTE_SUBCOMMANDS: FrozenSet[str] = frozenset({"push", "fetch", "pull"})
+    LOCAL_BRANCH_SUBCOMMANDS: FrozenSet[str] = frozenset(
+        {"checkout", "switch", "branch", "update-ref"}
+    )
+    WORKTREE_SUBCOMMANDS: FrozenSet[str] = frozenset(
+        {
+            "add", "commit", "checkout", "switch", "stash", "reset", "clean",
+            "rebase", "merge", "pull", "restore", "rm", "mv", "cherry-pick",
+            "revert",
+        }
+    )
+    REF_SUBCOMMANDS: FrozenSet[str] = frozenset(
+        {
+            "fetch", "pull", "reset", "checkout", "switch", "branch", "merge",
+            "rebase", "commit", "update-ref", "stash", "cherry-pick", "revert",
+        }
+    )
+    HEAD_SUBCOMMANDS: FrozenSet[str] = frozenset(
+        {"checkout", "switch", "branch", "rebase", "reset"}
+    )
+    # Marcadores que git deja en .git mientras una operación está detenida
+    OPERATION_MARKERS: Dict[str, Tuple[str, ...]] = {
+        "rebase": ("rebase-merge", "rebase-apply"),
+        "merge": ("MERGE_HEAD",),
+        "cherry-pick": ("CHERRY_PICK_HEAD", "sequencer"),
+    }
+
     def __init__(self, config: "ExtendedConfigType"):
         """
         Inicializa la clase GitClass con la configuración proporcionada
@@ -30,17 +80,40 @@ class GitClass(GlobalClass):
         super().__init__(selected_config=config)
 
         self.git_config: ExtendedConfigType = config
-        self.repo_path: Optional[str] = config.get("repo_path")
+        self.repo_path: Optional[str] = config.repo_path
 
         if self.repo_path:
-            self.git_logger: GitLogClass = GitLogClass(self.repo_path)
+            # Las escrituras del log se hacen en segundo plano
+            self.git_logger: GitLogClass = GitQueueLogClass(self.repo_path)
         else:
             raise ValueError("repo_path es requerido para GitClass")
 
         self.validate_required_fields(["base_branch", "feature_branch"], self.repo_path)
 
-        self.base_branch: Optional[str] = config.get("base_branch")
-        self.feature_branch: Optional[str] = config.get("feature_branch")
+        self.base_branch: Optional[str] = config.base_branch
+        self.feature_branch: Optional[str] = config.feature_branch
+
+        # Caché de ramas remotas por remoto: {remoto: (timestamp, ramas)}
+        self.remote_refs_cache: Dict[str, Tuple[float, Set[str]]] = {}
+        # Momento del último fetch/pull exitoso (time.monotonic)
+        self.last_fetch_ts: Optional[float] = None
+        # Caché de ramas locales (None hasta la primera consulta)
+        self.local_refs_cache: Optional[Set[str]] = None
+        # Ruta absoluta del directorio .git (se resuelve una sola vez)
+        self.git_dir: Optional[str] = None
+        # Rama actual (None hasta consultarla o tras cambiar de rama)
+        self.current_branch: Optional[str] = None
+        # Proceso persistente de cat-file para verificar referencias
+        self._cat_file_proc: Optional["subprocess.Popen[str]"] = None
+        # Se cierra al salir; se registra una sola vez aunque el proceso se relance
+        atexit.register(self.close_ref_checker)
+        # Caché de referencias verificadas: {referencia: sha o None si no existe}
+        self.ref_cache: Dict[str, Optional[str]] = {}
+        # Caché de git status (None hasta consultarlo o tras un comando que lo cambie)
+        self.status_cache: Optional[List[StatusEntryType]] = None
+        # Repositorio abierto con pygit2 (se abre al primer uso si está disponible)
+        self._pygit2_repo: Optional["pygit2.Repository"] = None
+        self._pygit2_checked: bool = False
 
         # Inicializar gestores especializados
         self.branch_manager = GitBranchManager(self)
@@ -75,44 +148,53 @@ class GitClass(GlobalClass):
         return self.feature_branch
 
     def run_git_command(
-        self, command: str, allow_failure: bool = False
+        self,
+        command: Union[str, List[str]],
+        allow_failure: bool = False,
+        echo_output: bool = True,
     ) -> "GitCommandResult":
         """
         Ejecuta un comando git y retorna la salida
 
         Args:
-            command: El comando git a ejecutar
+            command: El comando git a ejecutar. Si es una lista de argumentos
+                se ejecuta directamente sin pasar por la shell
             allow_failure: Si True, no termina el programa en caso de error
+            echo_output: Si False, la salida solo se captura y no se muestra
 
         Returns:
             GitCommandResult con returncode, stdout y stderr
         """
+        use_shell = isinstance(command, str)
+        display_command = command if isinstance(command, str) else " ".join(command)
+
         try:
-            self.colors.info(f"▶ Ejecutando: {command}")
+            self.colors.info(f"▶ Ejecutando: {display_command}")
 
             result = subprocess.run(
                 command,
-                shell=True,
+                shell=use_shell,
                 capture_output=True,
                 text=True,
                 cwd=self.repo_path,
             )
 
             if result.returncode == 0:
-                if result.stdout.strip():
+                if echo_output and result.stdout.strip():
                     self.colors.success(f"\n{result.stdout.strip()}\n")
             else:
                 if not allow_failure:
                     if result.stderr.strip():
                         self.colors.error(f"Error: {result.stderr.strip()}")
 
-            result_dict: "GitCommandResult" = {
-                "returncode": result.returncode,
-                "stdout": result.stdout.strip() if result.stdout else "",
-                "stderr": result.stderr.strip() if result.stderr else "",
-            }
+            result_dict = GitCommandResult(
+                returncode=result.returncode,
+                stdout=result.stdout.strip() if result.stdout else "",
+                stderr=result.stderr.strip() if result.stderr else "",
+            )
 
-            self.git_logger.log_git_command(command, result_dict)
+            self.git_logger.log_git_command(display_command, result_dict)
+            self._after_command(command, result.returncode)
 
             if result.returncode != 0 and not allow_failure:
                 self.git_logger.log_error(
@@ -125,13 +207,13 @@ class GitClass(GlobalClass):
         except Exception as e:
             self.colors.error(f"Error inesperado: {str(e)}")
 
-            error_result: "GitCommandResult" = {
-                "returncode": -1,
-                "stdout": "",
-                "stderr": str(e),
-            }
+            error_result = GitCommandResult(
+                returncode=-1,
+                stdout="",
+                stderr=str(e),
+            )
 
-            self.git_logger.log_git_command(command, error_result)
+            self.git_logger.log_git_command(display_command, error_result)
             self.git_logger.log_error(f"Error inesperado: {str(e)}", "run_git_command")
 
             if not allow_failure:
@@ -139,63 +221,823 @@ class GitClass(GlobalClass):
 
             return error_result
 
+    @staticmethod
+    def quote_arg(value: str) -> str:
+        """
+        Escapa un valor para insertarlo en un comando ejecutado por la shell
+
+        Args:
+            value: Valor a escapar (mensaje de commit, nombre de rama...)
+
+        Returns:
+            Valor escapado según la shell de la plataforma (cmd.exe o POSIX)
+        """
+        if os.name == "nt":
+            return subprocess.list2cmdline([value])
+        return shlex.quote(value)
+
+    def run_git_batch(self, commands: List[str]) -> List[str]:
+        """
+        Ejecuta varios comandos git independientes y de solo lectura en un
+        único proceso de shell, separando su salida con BATCH_SEPARATOR
+
+        Args:
+            commands: Comandos a ejecutar; cada uno debe dejar su salida vacía
+                si falla, ya que no se distingue el código de salida individual.
+                Los valores variables deben ir escapados con quote_arg
+
+        Returns:
+            Lista con la salida estándar de cada comando, en el mismo orden
+        """
+        # Los comandos deben seguir aunque uno falle: en POSIX eso es ";", pero
+        # cmd.exe (la shell de subprocess en Windows) no conoce ";" como
+        # separador y usa "&" para lo mismo
+        joiner = " & " if os.name == "nt" else " ; "
+        separator = f"{joiner}echo {self.BATCH_SEPARATOR}{joiner}"
+        # La salida conjunta (con los separadores) solo se captura para repartirla
+        result = self.run_git_command(
+            separator.join(commands), allow_failure=True, echo_output=False
+        )
+
+        outputs: List[List[str]] = [[]]
+        for line in result.stdout.splitlines():
+            # cmd.exe deja un espacio al final del echo, se compara sin espacios
+            if line.strip() == self.BATCH_SEPARATOR:
+                outputs.append([])
+            else:
+                outputs[-1].append(line)
+
+        outputs.extend([] for _ in range(len(commands) - len(outputs)))
+        return ["\n".join(lines).strip() for lines in outputs[: len(commands)]]
+
+    def run_git_command_check(
+        self, command: Union[str, List[str]], allow_failure: bool = False
+    ) -> "GitCommandResult":
+        """
+        Ejecuta un comando git cuya salida estándar no se necesita; esta va
+        directo a la terminal y solo se captura stderr
+
+        Args:
+            command: El comando git a ejecutar. Si es una lista de argumentos
+                se ejecuta directamente sin pasar por la shell
+            allow_failure: Si True, no termina el programa en caso de error
+
+        Returns:
+            GitCommandResult con returncode y stderr; stdout siempre vacío
+        """
+        use_shell = isinstance(command, str)
+        display_command = command if isinstance(command, str) else " ".join(command)
+
+        try:
+            self.colors.info(f"▶ Ejecutando: {display_command}")
+
+            sys.stdout.flush()
+            process = subprocess.Popen(
+                command,
+                shell=use_shell,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=self.repo_path,
+            )
+            _, stderr = process.communicate()
+            stderr = stderr.strip() if stderr else ""
+
+            if process.returncode != 0 and not allow_failure and stderr:
+                self.colors.error(f"Error: {stderr}")
+
+            result_dict = GitCommandResult(
+                returncode=process.returncode,
+                stdout="",
+                stderr=stderr,
+            )
+
+            self.git_logger.log_git_command(display_command, result_dict)
+            self._after_command(command, process.returncode)
+
+            if process.returncode != 0 and not allow_failure:
+                self.git_logger.log_error(
+                    f"Error al ejecutar comando: {stderr}", "run_git_command_check"
+                )
+                sys.exit(1)
+
+            return result_dict
+
+        except Exception as e:
+            self.colors.error(f"Error inesperado: {str(e)}")
+
+            error_result = GitCommandResult(
+                returncode=-1,
+                stdout="",
+                stderr=str(e),
+            )
+
+            self.git_logger.log_git_command(display_command, error_result)
+            self.git_logger.log_error(
+                f"Error inesperado: {str(e)}", "run_git_command_check"
+            )
+
+            if not allow_failure:
+                sys.exit(1)
+
+            return error_result
+
+    def run_git_command_stream(
+        self,
+        command: Union[str, List[str]],
+        line_handler: Optional[Callable[[str], None]] = None,
+        background: bool = False,
+    ) -> int:
+        """
+        Ejecuta un comando git sin capturar su salida completa en memoria
+
+        Args:
+            command: Lista de argumentos del comando git, o cadena que se
+                ejecuta con la shell (por ejemplo, varios comandos encadenados)
+            line_handler: Si se indica, recibe cada línea de la salida estándar
+                (sin el salto de línea); si no, la salida va directo a la terminal.
+                La salida de error va a la terminal salvo en segundo plano
+            background: Si True, el comando corre mientras el usuario escribe:
+                no se anuncia, no usa la terminal y no puede pedir credenciales
+
+        Returns:
+            Código de salida del comando
+        """
+        use_shell = isinstance(command, str)
+        display_command = command if isinstance(command, str) else " ".join(command)
+        if not background:
+            self.colors.info(f"▶ Ejecutando: {display_command}")
+
+        # En segundo plano el proceso no comparte la terminal con input(): sin
+        # stdin ni stderr, en otra sesión y con los avisos de credenciales apagados
+        background_options: Dict[str, object] = {}
+        if background:
+            env = dict(os.environ, GIT_TERMINAL_PROMPT="0", GCM_INTERACTIVE="never")
+            env.setdefault("GIT_SSH_COMMAND", "ssh -o BatchMode=yes")
+            background_options = {
+                "stdin": subprocess.DEVNULL,
+                "stderr": subprocess.DEVNULL,
+                "env": env,
+                "start_new_session": os.name != "nt",
+            }
+
+        try:
+            sys.stdout.flush()
+            if line_handler is None:
+                returncode = subprocess.run(
+                    command, shell=use_shell, cwd=self.repo_path, **background_options
+                ).returncode
+            else:
+                with subprocess.Popen(
+                    command,
+                    shell=use_shell,
+                    stdout=subprocess.PIPE,
+                    text=True,
+                    cwd=self.repo_path,
+                    **background_options,
+                ) as process:
+                    for line in process.stdout:
+                        line_handler(line.rstrip("\n"))
+                returncode = process.returncode
+        except Exception as e:
+            self.colors.error(f"Error inesperado: {str(e)}")
+            self.git_logger.log_error(f"Error inesperado: {str(e)}", "run_git_command_stream")
+            return -1
+
+        result_dict = GitCommandResult(
+            returncode=returncode,
+            stdout="",
+            stderr="",
+        )
+        self.git_logger.log_git_command(display_command, result_dict)
+        self._after_command(command, returncode)
+        return returncode
+
+    @staticmethod
+    def git_subcommands(command: Union[str, List[str]]) -> Set[str]:
+        """
+        Obtiene los subcomandos git de un comando (lista de argumentos o
+        cadena con varios comandos encadenados por la shell)
+
+        Args:
+            command: El comando git ejecutado
+
+        Returns:
+            Conjunto de subcomandos (checkout, commit...); "stash list" y
+            "stash show" no se incluyen porque solo leen
+        """
+        if isinstance(command, str):
+            try:
+                tokens = shlex.split(command)
+            except ValueError:
+                tokens = command.split()
+        else:
+            tokens = list(command)
+
+        # Se separa la cadena en comandos por sus operadores y se quitan los paréntesis
+        segments: List[List[str]] = [[]]
+        for token in tokens:
+            if token in ("&&", "||", ";", "&", "|"):
+                segments.append([])
+            else:
+                token = token.strip("()")
+                if token:
+                    segments[-1].append(token)
+
+        subcommands: Set[str] = set()
+        for segment in segments:
+            if not segment or segment[0] != "git":
+                continue
+            index = 1
+            # Se saltan las opciones globales (-c clave=valor, -C ruta, --no-pager...)
+            while index < len(segment) and segment[index].startswith("-"):
+                index += 2 if segment[index] in ("-c", "-C") else 1
+            if index >= len(segment):
+                continue
+            subcommand = segment[index]
+            arguments = segment[index + 1:]
+            if subcommand == "stash" and arguments[:1] in (["list"], ["show"]):
+                continue
+            subcommands.add(subcommand)
+        return subcommands
+
+    def _after_command(self, command: Union[str, List[str]], returncode: int) -> None:
+        """
+        Actualiza las cachés y marcas de tiempo afectadas por un comando,
+        según sus subcomandos git
+
+        Args:
+            command: El comando git que se acaba de ejecutar
+            returncode: Código de salida del comando
+        """
+        subcommands = self.git_subcommands(command)
+        if not subcommands:
+            return
+
+        if subcommands & self.REMOTE_SUBCOMMANDS:
+            self.remote_refs_cache.clear()
+
+        if returncode == 0 and subcommands & {"fetch", "pull"}:
+            self.last_fetch_ts = time.monotonic()
+
+        if returncode == 0 and subcommands & self.LOCAL_BRANCH_SUBCOMMANDS:
+            self.local_refs_cache = None
+
+        # Los comandos que tocan el índice o el árbol de trabajo invalidan el status
+        if subcommands & self.WORKTREE_SUBCOMMANDS:
+            self.status_cache = None
+
+        # Cualquier comando que mueva referencias invalida las ya verificadas
+        if subcommands & self.REF_SUBCOMMANDS:
+            self.ref_cache.clear()
+
+        # Aunque fallen, checkout/rebase pueden dejar HEAD en otra posición,
+        # igual que un pull --rebase detenido por conflictos
+        if subcommands & self.HEAD_SUBCOMMANDS or (returncode != 0 and "pull" in subcommands):
+            self.invalidate_branch_cache()
+
+    def before_menu_action(self) -> None:
+        """
+        Descarta las cachés del estado local antes de cada acción del menú,
+        ya que el repositorio puede haber cambiado fuera del programa
+        """
+        self.status_cache = None
+        self.local_refs_cache = None
+        self.ref_cache.clear()
+        self.invalidate_branch_cache()
+
+    def invalidate_branch_cache(self) -> None:
+        """Descarta la rama actual memorizada para volver a consultarla"""
+        self.current_branch = None
+
+    def get_current_branch_name(self) -> str:
+        """
+        Obtiene la rama actual, consultándola a git solo si no está memorizada
+
+        Returns:
+            Nombre de la rama actual (vacío si HEAD está desacoplado)
+        """
+        if self.current_branch is None:
+            result = self.run_git_command(
+                ["git", "symbolic-ref", "--short", "-q", "HEAD"], allow_failure=True
+            )
+            self.current_branch = result.stdout if result.returncode == 0 else ""
+        return self.current_branch
+
+    def fetched_recently(self, max_age: Optional[float] = None) -> bool:
+        """
+        Indica si hubo un fetch exitoso hace menos de `max_age` segundos
+
+        Args:
+            max_age: Antigüedad máxima aceptada, por defecto FETCH_FRESHNESS_SECONDS
+
+        Returns:
+            True si las referencias remotas locales se consideran al día
+        """
+        if self.last_fetch_ts is None:
+            return False
+        if max_age is None:
+            max_age = self.FETCH_FRESHNESS_SECONDS
+        return time.monotonic() - self.last_fetch_ts < max_age
+
+    def list_remote_heads(self, remote: str = "origin", ttl: float = 30.0) -> Set[str]:
+        """
+        Obtiene las ramas del remoto con un solo ls-remote y las cachea
+
+        Args:
+            remote: Nombre del remoto
+            ttl: Segundos durante los que el resultado en caché es válido
+
+        Returns:
+            Conjunto con los nombres de las ramas del remoto
+        """
+        cached = self.remote_refs_cache.get(remote)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        heads: Set[str] = set()
+
+        def add_head(line: str) -> None:
+            _, _, ref = line.partition("\t")
+            if ref.startswith("refs/heads/"):
+                heads.add(ref[len("refs/heads/"):])
+
+        returncode = self.run_git_command_stream(
+            ["git", "ls-remote", "--heads", remote], line_handler=add_head
+        )
+        if returncode != 0:
+            return set()
+
+        self.remote_refs_cache[remote] = (time.monotonic(), heads)
+        return heads
+
+    def get_git_dir(self) -> str:
+        """
+        Obtiene la ruta absoluta del directorio .git del repositorio
+
+        Returns:
+            Ruta del directorio .git (vacía si no se pudo resolver)
+        """
+        if self.git_dir is None:
+            result = self.run_git_command(
+                ["git", "rev-parse", "--absolute-git-dir"], allow_failure=True
+            )
+            if result.returncode != 0:
+                return ""
+            self.git_dir = result.stdout
+        return self.git_dir
+
+    def is_operation_in_progress(self, operation: Optional[str] = None) -> bool:
+        """
+        Indica si hay una operación de git detenida esperando resolución,
+        revisando los marcadores que git deja en .git sin lanzar procesos
+
+        Args:
+            operation: "rebase", "merge" o "cherry-pick"; si es None se
+                revisan todas
+
+        Returns:
+            True si la operación (o alguna, si no se indica) está en curso
+        """
+        git_dir = self.get_git_dir()
+        if not git_dir:
+            return False
+
+        if operation is None:
+            markers = [m for group in self.OPERATION_MARKERS.values() for m in group]
+        else:
+            markers = list(self.OPERATION_MARKERS[operation])
+        return any(os.path.exists(os.path.join(git_dir, marker)) for marker in markers)
+
+    def has_unresolved_conflicts(self) -> bool:
+        """
+        Indica si un rebase, merge o cherry-pick quedó detenido esperando
+        resolución, revisando los marcadores que git deja en .git
+
+        Returns:
+            True si hay una operación detenida por conflictos
+        """
+        return self.is_operation_in_progress()
+
+    def get_pygit2_repo(self) -> Optional["pygit2.Repository"]:
+        """
+        Abre el repositorio con pygit2 la primera vez que se necesita
+
+        Returns:
+            Repositorio de pygit2, o None si pygit2 no está instalado o falla
+        """
+        if not self._pygit2_checked:
+            self._pygit2_checked = True
+            if pygit2 is not None:
+                try:
+                    self._pygit2_repo = pygit2.Repository(self.repo_path)
+                except Exception:
+                    self._pygit2_repo = None
+        return self._pygit2_repo
+
+    def get_status(self, force: bool = False) -> List["StatusEntryType"]:
+        """
+        Obtiene los cambios locales con git status --porcelain=v2 -z y los
+        reutiliza hasta que un comando modifique el índice o el árbol
+
+        Args:
+            force: Si True, ignora la caché y vuelve a consultar
+
+        Returns:
+            Lista de (XY, ruta) con el formato de estado de porcelain v1
+        """
+        if self.status_cache is not None and not force:
+            return self.status_cache
+
+        result = self.run_git_command(
+            ["git", "status", "--porcelain=v2", "-z"], allow_failure=True
+        )
+        if result.returncode != 0:
+            return []
+
+        entries: List["StatusEntryType"] = []
+        records = iter(result.stdout.split("\0"))
+        for record in records:
+            if record.startswith(("1 ", "2 ", "u ")):
+                fields = record.split(" ", {"1": 8, "2": 9, "u": 10}[record[0]])
+                # En v2 "." indica sin cambios; en v1 es un espacio
+                entries.append((fields[1].replace(".", " "), fields[-1]))
+                if record[0] == "2":
+                    next(records, "")
+            elif record.startswith("? "):
+                entries.append(("??", record[2:]))
+
+        self.status_cache = entries
+        return entries
+
+    @staticmethod
+    def format_status_short(entries: List["StatusEntryType"]) -> str:
+        """
+        Da formato de git status --short a entradas ya obtenidas, coloreando
+        en verde lo preparado y en rojo lo pendiente, sin volver a consultar
+
+        Args:
+            entries: Lista de (XY, ruta) devuelta por get_status
+
+        Returns:
+            Líneas "XY ruta" listas para mostrar
+        """
+        lines = []
+        for xy, path in entries:
+            if xy == "??":
+                lines.append(f"{Fore.RED}??{Fore.RESET} {path}")
+            else:
+                lines.append(
+                    f"{Fore.GREEN}{xy[0]}{Fore.RED}{xy[1]}{Fore.RESET} {path}"
+                )
+        return "\n".join(lines)
+
+    def has_local_changes(self) -> bool:
+        """
+        Indica si hay cambios locales, incluidos archivos no rastreados
+
+        Returns:
+            True si git status --porcelain tendría alguna línea
+        """
+        repo = self.get_pygit2_repo()
+        if repo is not None:
+            return bool(repo.status())
+
+        return bool(self.get_status())
+
+    def has_stashes(self) -> bool:
+        """
+        Indica si existe al menos un stash guardado
+
+        Returns:
+            True si git stash list tendría alguna línea
+        """
+        repo = self.get_pygit2_repo()
+        if repo is not None:
+            return bool(repo.listall_stashes())
+
+        result = self.run_git_command("git stash list", allow_failure=True)
+        return bool(result.stdout.strip())
+
+    def verify_ref(self, ref: str) -> Optional[str]:
+        """
+        Verifica una referencia con pygit2 si está disponible o, si no, con
+        un proceso git cat-file --batch-check que se mantiene abierto
+
+        Args:
+            ref: Referencia o revisión a verificar (rama, tag, sha...)
+
+        Returns:
+            SHA del objeto si la referencia existe, None en caso contrario
+        """
+        repo = self.get_pygit2_repo()
+        if repo is not None:
+            try:
+                return str(repo.revparse_single(ref).id)
+            except (KeyError, ValueError, pygit2.GitError):
+                return None
+
+        for _ in range(2):
+            proc = self._get_cat_file_proc()
+            try:
+                assert proc.stdin is not None and proc.stdout is not None
+                proc.stdin.write(f"{ref}\n")
+                proc.stdin.flush()
+                line = proc.stdout.readline()
+            except (BrokenPipeError, OSError):
+                line = ""
+
+            if line:
+                sha, _, object_type = line.strip().partition(" ")
+                # Las referencias inexistentes o ambiguas responden "<ref> missing/ambiguous"
+                return sha if object_type in ("commit", "tree", "blob", "tag") else None
+
+            # El proceso terminó: se descarta y se vuelve a lanzar una vez
+            self.close_ref_checker()
+
+        return None
+
+    def verify_ref_cached(self, ref: str) -> Optional[str]:
+        """
+        Igual que verify_ref, pero reutiliza el resultado mientras ningún
+        comando haya movido referencias
+
+        Args:
+            ref: Referencia o revisión a verificar
+
+        Returns:
+            SHA del objeto si la referencia existe, None en caso contrario
+        """
+        if ref not in self.ref_cache:
+            self.ref_cache[ref] = self.verify_ref(ref)
+        return self.ref_cache[ref]
+
+    def _get_cat_file_proc(self) -> "subprocess.Popen[str]":
+        """Lanza el proceso de cat-file la primera vez que se necesita"""
+        if self._cat_file_proc is None or self._cat_file_proc.poll() is not None:
+            self._cat_file_proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                cwd=self.repo_path,
+            )
+        return self._cat_file_proc
+
+    def close_ref_checker(self) -> None:
+        """Cierra el proceso persistente de cat-file si está abierto"""
+        proc, self._cat_file_proc = self._cat_file_proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+
+    def remote_head_sha(
+        self, branch: str, remote: str = "origin", background: bool = False
+    ) -> Optional[str]:
+        """
+        Consulta con ls-remote el commit al que apunta una rama del remoto,
+        sin descargar objetos
+
+        Args:
+            branch: Nombre de la rama
+            remote: Nombre del remoto
+            background: Si True, la consulta no usa la terminal (ver
+                run_git_command_stream); si necesitara credenciales, falla
+
+        Returns:
+            SHA de la rama remota, o None si no existe o no se pudo consultar
+        """
+        shas: List[str] = []
+        returncode = self.run_git_command_stream(
+            ["git", "ls-remote", remote, f"refs/heads/{branch}"],
+            line_handler=lambda line: shas.append(line.split()[0]),
+            background=background,
+        )
+        if returncode != 0 or not shas:
+            return None
+        return shas[0]
+
+    def list_local_heads(self) -> Set[str]:
+        """
+        Obtiene las ramas locales con un solo for-each-ref y las cachea
+        hasta el siguiente comando que cree, elimine o cambie de rama
+
+        Returns:
+            Conjunto con los nombres de las ramas locales
+        """
+        if self.local_refs_cache is not None:
+            return self.local_refs_cache
+
+        heads: Set[str] = set()
+
+        def add_head(line: str) -> None:
+            if line.startswith("refs/heads/"):
+                heads.add(line[len("refs/heads/"):])
+
+        returncode = self.run_git_command_stream(
+            ["git", "for-each-ref", "--format=%(refname)", "refs/heads/"],
+            line_handler=add_head,
+        )
+        if returncode != 0:
+            return set()
+
+        self.local_refs_cache = heads
+        return self.local_refs_cache
+
+    def ahead_behind(self, branch: str, remote: str = "origin") -> Optional[Tuple[int, int]]:
+        """
+        Calcula en una sola llamada cuántos commits va la rama local adelante
+        y atrás respecto a su rama remota
+
+        Args:
+            branch: Nombre de la rama
+            remote: Nombre del remoto
+
+        Returns:
+            Tupla (adelante, atrás) o None si no existe la referencia remota
+        """
+        result = self.run_git_command(
+            ["git", "rev-list", "--left-right", "--count", f"HEAD...{remote}/{branch}"],
+            allow_failure=True,
+        )
+        if result.returncode != 0:
+            return None
+
+        ahead, behind = result.stdout.split()
+        return int(ahead), int(behind)
+
+    def preview_merge(self, ours: str, theirs: str) -> Optional[Tuple[str, List[str]]]:
+        """
+        Simula en memoria el merge de dos commits con merge-tree --write-tree,
+        sin tocar el índice ni el árbol de trabajo
+
+        Args:
+            ours: Commit sobre el que se haría el merge
+            theirs: Commit que se integraría
+
+        Returns:
+            Tupla (árbol resultante, rutas en conflicto) o None si no se pudo
+            simular (por ejemplo, con versiones de git anteriores a 2.38)
+        """
+        result = self.run_git_command(
+            ["git", "merge-tree", "--write-tree", "--name-only", ours, theirs],
+            allow_failure=True,
+            echo_output=False,
+        )
+        # 0 indica merge limpio y 1 merge con conflictos; otro código es un error
+        if result.returncode not in (0, 1) or not result.stdout:
+            return None
+
+        # Primera línea: árbol; luego las rutas en conflicto hasta una línea vacía
+        lines = result.stdout.splitlines()
+        conflicts: List[str] = []
+        if result.returncode == 1:
+            for line in lines[1:]:
+                if not line:
+                    break
+                conflicts.append(line)
+        return lines[0], conflicts
+
+    def get_worktree_changes(self) -> str:
+        """
+        Obtiene los cambios locales en archivos versionados, sin recorrer
+        los archivos no rastreados ni tomar locks opcionales del índice
+
+        Returns:
+            Salida de git status --porcelain (vacía si no hay cambios)
+        """
+        result = self.run_git_command(
+            ["git", "--no-optional-locks", "status", "--porcelain", "-uno"],
+            allow_failure=True,
+        )
+        return result.stdout.strip()
+
+    def is_worktree_dirty(self) -> bool:
+        """
+        Indica si hay cambios locales en archivos versionados
+
+        Returns:
+            True si existe alguna modificación local
+        """
+        return bool(self.get_worktree_changes())
+
+    def get_branch_status(self) -> "BranchStatusType":
+        """
+        Obtiene rama actual, upstream, commits adelante/atrás y archivos
+        modificados con una sola llamada a git status --porcelain=v2 --branch
+
+        Returns:
+            BranchStatusType con el estado de la rama y los paths modificados
+        """
+        result = self.run_git_command(
+            ["git", "status", "--porcelain=v2", "--branch", "-z"]
+        )
+
+        status: "BranchStatusType" = {
+            "branch": "",
+            "upstream": None,
+            "ahead": 0,
+            "behind": 0,
+            "paths": [],
+            "unstaged": [],
+        }
+
+        records = iter(result.stdout.split("\0"))
+        for record in records:
+            if not record:
+                continue
+
+            if record.startswith("# branch.head "):
+                head = record[len("# branch.head "):]
+                status["branch"] = "" if head == "(detached)" else head
+            elif record.startswith("# branch.upstream "):
+                status["upstream"] = record[len("# branch.upstream "):]
+            elif record.startswith("# branch.ab "):
+                ahead, behind = record[len("# branch.ab "):].split()
+                status["ahead"] = int(ahead)
+                status["behind"] = -int(behind)
+            elif record.startswith("#"):
+                continue
+            elif record.startswith(("1 ", "2 ", "u ")):
+                fields = record.split(" ", {"1": 8, "2": 9, "u": 10}[record[0]])
+                path = fields[-1]
+                status["paths"].append(path)
+                # Los renombrados traen la ruta original en el siguiente registro
+                if record[0] == "2":
+                    status["paths"].append(next(records, ""))
+                # El segundo carácter de XY indica cambios aún no agregados al índice
+                if fields[1][1] != ".":
+                    status["unstaged"].append(path)
+            elif record.startswith("? "):
+                status["paths"].append(record[2:])
+                status["unstaged"].append(record[2:])
+
+        self.current_branch = status["branch"]
+        return status
+
     def display_git_menu(self) -> None:
         """Muestra el menú de opciones de forma persistente"""
-        options: List["MenuOptionType"] = [
-            {
-                "function": self.get_repo_status,
-                "description": "📊 Obtener el estado del repositorio",
-            },
-            {
-                "function": self.get_current_branch,
-                "description": "🌿 Mostrar mi rama actual",
-            },
-            {
-                "function": self.pull_current_branch,
-                "description": f"📥 PULL: Obtener cambios de mi equipo en mi rama actual",
-            },
-            {
-                "function": self.pull_base_branch,
-                "description": f"⚡ PULL DIRECTO: Traer cambios de {Fore.BLUE}{self.base_branch}{Fore.RESET} (sin importar conflictos)",
-            },
-            {
-                "function": self._handle_rebase,
-                "description": f"🔄 REBASE: Integrar cambios de {Fore.BLUE}{self.base_branch}{Fore.RESET} a {Fore.YELLOW}{self.feature_branch}{Fore.RESET}",
-            },
-            {
-                "function": self.upload_changes,
-                "description": "📤 Subir mis cambios al repositorio remoto",
-            },
-            {
-                "function": self.create_branch_feature,
-                "description": f"🌱 Crear la rama feature: {Fore.YELLOW}{self.feature_branch}{Fore.RESET}",
-            },
-            {
-                "function": self.reset_to_base_with_backup,
-                "description": f"🔄 RESET COMPLETO: Empezar desde {Fore.BLUE}{self.base_branch}{Fore.RESET} (con backup)",
-            },
-            {
-                "function": self.update_base_branch,
-                "description": f"🔄 ACTUALIZAR RAMA BASE: Traer últimos cambios de {Fore.BLUE}{self.base_branch}{Fore.RESET}",
-            },
-            {
-                "function": self.delete_branch,
-                "description": "🗑️ Eliminar una rama por nombre",
-            },
-            {
-                "function": self.abort_operations_menu,
-                "description": "🟥 Cancelar operaciones en progreso (merge/rebase/cherry-pick)",
-            },
-            {
-                "function": self.feature_branch_workflow,
-                "description": "🌟 Flujo completo de feature branch (GitFlow CONACYT), ESPECIFICO",
-            },
-            {
-                "function": self.restore_local_changes,
-                "description": "📦 Restaurar cambios guardados (stash)",
-            },
-            {"function": self.view_today_logs, "description": "📋 Ver logs de hoy"},
-            {"function": self.restart_program, "description": "🔄 Cambiar de repositorio/configuración"},
+        options: List["MenuOption"] = [
+            MenuOption(
+                function=self.get_repo_status,
+                description="📊 Obtener el estado del repositorio",
+            ),
+            MenuOption(
+                function=self.get_current_branch,
+                description="🌿 Mostrar mi rama actual",
+            ),
+            MenuOption(
+                function=self.pull_current_branch,
+                description=f"📥 PULL: Obtener cambios de mi equipo en mi rama actual",
+            ),
+            MenuOption(
+                function=self.pull_base_branch,
+                description=f"⚡ PULL DIRECTO: Traer cambios de {Fore.BLUE}{self.base_branch}{Fore.RESET} (sin importar conflictos)",
+            ),
+            MenuOption(
+                function=self._handle_rebase,
+                description=f"🔄 REBASE: Integrar cambios de {Fore.BLUE}{self.base_branch}{Fore.RESET} a {Fore.YELLOW}{self.feature_branch}{Fore.RESET}",
+            ),
+            MenuOption(
+                function=self.upload_changes,
+                description="📤 Subir mis cambios al repositorio remoto",
+            ),
+            MenuOption(
+                function=self.create_branch_feature,
+                description=f"🌱 Crear la rama feature: {Fore.YELLOW}{self.feature_branch}{Fore.RESET}",
+            ),
+            MenuOption(
+                function=self.reset_to_base_with_backup,
+                description=f"🔄 RESET COMPLETO: Empezar desde {Fore.BLUE}{self.base_branch}{Fore.RESET} (con backup)",
+            ),
+            MenuOption(
+                function=self.update_base_branch,
+                description=f"🔄 ACTUALIZAR RAMA BASE: Traer últimos cambios de {Fore.BLUE}{self.base_branch}{Fore.RESET}",
+            ),
+            MenuOption(
+                function=self.delete_branch,
+                description="🗑️ Eliminar una rama por nombre",
+            ),
+            MenuOption(
+                function=self.abort_operations_menu,
+                description="🟥 Cancelar operaciones en progreso (merge/rebase/cherry-pick)",
+            ),
+            MenuOption(
+                function=self.feature_branch_workflow,
+                description="🌟 Flujo completo de feature branch (GitFlow CONACYT), ESPECIFICO",
+            ),
+            MenuOption(
+                function=self.restore_local_changes,
+                description="📦 Restaurar cambios guardados (stash)",
+            ),
+            MenuOption(function=self.view_today_logs, description="📋 Ver logs de hoy"),
+            MenuOption(function=self.restart_program, description="🔄 Cambiar de repositorio/configuración"),
         ]
         self.show_menu(options)
 
@@ -203,7 +1045,7 @@ class GitClass(GlobalClass):
     
     def get_repo_status(self) -> None:
         """Obtiene el estado del repositorio"""
-        self.run_git_command("git status")
+        self.run_git_command_stream(["git", "status"])
 
     def get_current_branch(self) -> None:
         """Muestra todas las ramas y marca la actual"""
@@ -290,7 +1132,7 @@ class GitClass(GlobalClass):
                             self.colors.info(line)
 
             self.colors.info("=" * 80)
-            self.git_logger.log_operation("VIEW_LOGS", "Logs consultados", "INFO")
+            self.git_logger.log_operation_info("VIEW_LOGS", "Logs consultados")
 
         except Exception as e:
             self.colors.error(f"Error al leer logs: {str(e)}")
@@ -1,11 +1,38 @@
 import os
+import sys
+import time
 from datetime import datetime
-from src.types.configTypes import GitCommandResult, ExtendedConfigType, LogStatus
+from functools import lru_cache
+from typing import Dict
+from src.types.configTypes import (
+    GitCommandResult,
+    ExtendedConfigType,
+    LogStatus,
+    LOG_INFO,
+    LOG_SUCCESS,
+    LOG_WARNING,
+    LOG_ERROR,
+)
+
+
+# Prefijo "[fecha hora] " de un segundo dado; se arma una sola vez por segundo
+@lru_cache(maxsize=1)
+def _timestamp_prefix(second: int) -> str:
+    return f"[{datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')}] "
 
 
 # Clase para manejar logs diarios de las operaciones Git
 class GitLogClass:
 
+    # Atributos fijos de la instancia (sin __dict__)
+    __slots__ = ("repo_path", "logs_dir")
+
+    # Etiqueta "[STATUS] " de cada status ya armada, se busca por la constante internada
+    STATUS_LABELS: Dict[str, str] = {
+        status: sys.intern(f"[{status}] ")
+        for status in (LOG_INFO, LOG_SUCCESS, LOG_WARNING, LOG_ERROR)
+    }
+
     # Constructor de la clase
     def __init__(self, repo_path: str):
         """
@@ -49,9 +76,62 @@ class GitLogClass:
         filename = self._get_today_filename()
         return os.path.join(self.logs_dir, filename)
 
+    # Función para escribir un registro completo en el log de hoy
+    def _append_to_log(self, record: str, error_message: str = "No se pudo escribir en el log") -> None:
+        """
+        Escribe el registro ya armado con una sola escritura
+        @param {str} record: Texto completo del registro (una o varias líneas)
+        @param {str} error_message: Mensaje a mostrar si falla la escritura
+        """
+        try:
+            with open(self._get_log_file_path(), "a", encoding="utf-8") as log_file:
+                log_file.write(record)
+        except Exception as e:
+            # Si no se puede escribir el log, no fallar el programa
+            print(f"⚠️ {error_message}: {e}")
+
+    # Función para dar formato a una línea del log
+    def _format_log_line(
+        self, operation: str, details: str = "", status: "LogStatus" = LOG_INFO
+    ) -> str:
+        """
+        Crea la línea del log con la hora actual
+        @param {str} operation: Nombre de la operación
+        @param {str} details: Detalles adicionales
+        @param {LogStatus} status: Estado de la operación
+        @return {str}: Línea del log terminada en salto de línea
+        """
+        prefix = _timestamp_prefix(int(time.time()))
+        status_label = self.STATUS_LABELS.get(status) or f"[{status}] "
+        if details:
+            return f"{prefix}{status_label}{operation} - {details}\n"
+        return f"{prefix}{status_label}{operation}\n"
+
+    # Función para dar formato a una línea INFO del log (camino común, sin buscar el status)
+    def _format_info_line(self, operation: str, details: str = "") -> str:
+        """
+        Crea la línea INFO del log con la hora actual
+        @param {str} operation: Nombre de la operación
+        @param {str} details: Detalles adicionales
+        @return {str}: Línea del log terminada en salto de línea
+        """
+        prefix = _timestamp_prefix(int(time.time()))
+        if details:
+            return f"{prefix}[INFO] {operation} - {details}\n"
+        return f"{prefix}[INFO] {operation}\n"
+
+    # Función para registrar una operación INFO en el log diario
+    def log_operation_info(self, operation: str, details: str = "") -> None:
+        """
+        Registra una operación con status INFO en el log diario
+        @param {str} operation: Nombre de la operación
+        @param {str} details: Detalles adicionales
+        """
+        self._append_to_log(self._format_info_line(operation, details))
+
     # Función para registrar una operación en el log diario
     def log_operation(
-        self, operation: str, details: str = "", status: "LogStatus" = "INFO"
+        self, operation: str, details: str = "", status: "LogStatus" = LOG_INFO
     ) -> None:
         """
         Registra una operación en el log diario
@@ -59,22 +139,7 @@ class GitLogClass:
         @param {str} details: Detalles adicionales
         @param {LogStatus} status: Estado de la operación (INFO, SUCCESS, WARNING, ERROR)
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_file_path = self._get_log_file_path()
-
-        # Crear la línea del log
-        log_line = f"[{timestamp}] [{status}] {operation}"
-        if details:
-            log_line += f" - {details}"
-        log_line += "\n"
-
-        # Escribir en el archivo
-        try:
-            with open(log_file_path, "a", encoding="utf-8") as log_file:
-                log_file.write(log_line)
-        except Exception as e:
-            # Si no se puede escribir el log, no fallar el programa
-            print(f"⚠️ No se pudo escribir en el log: {e}")
+        self._append_to_log(self._format_log_line(operation, details, status))
 
     # Función para registrar un comando git ejecutado
     def log_git_command(self, command: str, result: "GitCommandResult") -> None:
@@ -83,11 +148,11 @@ class GitLogClass:
         @param {str} command: Comando ejecutado
         @param {GitCommandResult} result: Resultado del comando
         """
-        status = "SUCCESS" if result.get("returncode") == 0 else "ERROR"
+        status = LOG_SUCCESS if result.returncode == 0 else LOG_ERROR
         details = f"Command: {command}"
 
-        if result.get("stderr") and result.get("returncode") != 0:
-            details += f" | Error: {result.get('stderr')}"
+        if result.stderr and result.returncode != 0:
+            details += f" | Error: {result.stderr}"
 
         self.log_operation("GIT_COMMAND", details, status)
 
@@ -99,7 +164,7 @@ class GitLogClass:
         @param {str} option_description: Descripción de la opción
         """
         details = f"Option {option_number}: {option_description}"
-        self.log_operation("MENU_SELECTION", details, "INFO")
+        self.log_operation_info("MENU_SELECTION", details)
 
     # Función para registrar una entrada del usuario
     def log_user_input(self, input_type: str, value: str) -> None:
@@ -113,7 +178,7 @@ class GitLogClass:
             value = "***HIDDEN***"
 
         details = f"{input_type}: {value}"
-        self.log_operation("USER_INPUT", details, "INFO")
+        self.log_operation_info("USER_INPUT", details)
 
     # Función para registrar operaciones relacionadas con ramas
     def log_branch_operation(
@@ -129,11 +194,11 @@ class GitLogClass:
         if details:
             full_details += f" | {details}"
 
-        self.log_operation(f"BRANCH_{operation.upper()}", full_details, "INFO")
+        self.log_operation_info(f"BRANCH_{operation.upper()}", full_details)
 
     # Función para registrar operaciones de rebase
     def log_rebase_operation(
-        self, base_branch: str, feature_branch: str, status: "LogStatus" = "INFO"
+        self, base_branch: str, feature_branch: str, status: "LogStatus" = LOG_INFO
     ) -> None:
         """
         Registra operaciones de rebase
@@ -146,7 +211,7 @@ class GitLogClass:
 
     # Función para registrar operaciones de pull
     def log_pull_operation(
-        self, branch_name: str, status: "LogStatus" = "INFO"
+        self, branch_name: str, status: "LogStatus" = LOG_INFO
     ) -> None:
         """
         Registra operaciones de pull
@@ -158,7 +223,7 @@ class GitLogClass:
 
     # Función para registrar operaciones de push
     def log_push_operation(
-        self, branch_name: str, commit_message: str, status: "LogStatus" = "INFO"
+        self, branch_name: str, commit_message: str, status: "LogStatus" = LOG_INFO
     ) -> None:
         """
         Registra operaciones de push
@@ -171,7 +236,7 @@ class GitLogClass:
 
     # Función para registrar operaciones de stash
     def log_stash_operation(
-        self, operation: str, stash_message: str = "", status: "LogStatus" = "INFO"
+        self, operation: str, stash_message: str = "", status: "LogStatus" = LOG_INFO
     ) -> None:
         """
         Registra operaciones de stash
@@ -196,7 +261,7 @@ class GitLogClass:
         if context:
             details = f"{context} | {error_message}"
 
-        self.log_operation("ERROR", details, "ERROR")
+        self.log_operation("ERROR", details, LOG_ERROR)
 
     # Función para registrar advertencias
     def log_warning(self, warning_message: str, context: str = "") -> None:
@@ -209,7 +274,7 @@ class GitLogClass:
         if context:
             details = f"{context} | {warning_message}"
 
-        self.log_operation("WARNING", details, "WARNING")
+        self.log_operation("WARNING", details, LOG_WARNING)
 
     # Función para registrar operaciones exitosas
     def log_success(self, success_message: str, context: str = "") -> None:
@@ -222,7 +287,7 @@ class GitLogClass:
         if context:
             details = f"{context} | {success_message}"
 
-        self.log_operation("SUCCESS", details, "SUCCESS")
+        self.log_operation("SUCCESS", details, LOG_SUCCESS)
 
     # Función para registrar el inicio del programa con la configuración seleccionada
     def log_program_start(self, config: "ExtendedConfigType") -> None:
@@ -230,66 +295,62 @@ class GitLogClass:
         Registra el inicio del programa con la configuración seleccionada
         @param {ExtendedConfigType} config: Configuración seleccionada
         """
+        self._append_to_log(
+            self._format_program_start(config), "No se pudo escribir el log de inicio"
+        )
+
+    # Función para dar formato al bloque de inicio del programa
+    def _format_program_start(self, config: "ExtendedConfigType") -> str:
+        """
+        Arma el bloque de inicio del programa en un solo texto
+        @param {ExtendedConfigType} config: Configuración seleccionada
+        @return {str}: Bloque de inicio listo para escribir
+        """
         # Crear una línea separadora para el inicio
         separator = "=" * 80
         start_message = f"🚀 INICIO DEL PROGRAMA GIT"
 
         # Información de la configuración
-        config_info = f"Config: {config.get('name')}"
-        project_info = f"Proyecto: {config.get('project')}"
-        section_info = f"Sección: {config.get('section')}"
-        task_info = f"Tarea: {config.get('task')}"
-        repo_info = f"Repo: {config.get('repo_path')}"
-        base_branch_info = f"Rama base: {config.get('base_branch')}"
-        feature_branch_info = f"Rama feature: {config.get('feature_branch')}"
-
-        # Escribir el log de inicio
-        log_file_path = self._get_log_file_path()
-        try:
-            with open(log_file_path, "a", encoding="utf-8") as log_file:
-                log_file.write(f"\n{separator}\n")
-                log_file.write(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] {start_message}\n"
-                )
-                log_file.write(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] CONFIG_SELECTED - {config_info}\n"
-                )
-                log_file.write(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] PROJECT_INFO - {project_info}\n"
-                )
-                log_file.write(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] SECTION_INFO - {section_info}\n"
-                )
-                log_file.write(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] TASK_INFO - {task_info}\n"
-                )
-                log_file.write(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] REPO_INFO - {repo_info}\n"
-                )
-                log_file.write(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] BRANCH_INFO - {base_branch_info} | {feature_branch_info}\n"
-                )
-                log_file.write(f"{separator}\n")
-        except Exception as e:
-            print(f"⚠️ No se pudo escribir el log de inicio: {e}")
+        config_info = f"Config: {config.name}"
+        project_info = f"Proyecto: {config.project}"
+        section_info = f"Sección: {config.section}"
+        task_info = f"Tarea: {config.task}"
+        repo_info = f"Repo: {config.repo_path}"
+        base_branch_info = f"Rama base: {config.base_branch}"
+        feature_branch_info = f"Rama feature: {config.feature_branch}"
+
+        return "".join(
+            [
+                f"\n{separator}\n",
+                self._format_log_line(start_message),
+                self._format_log_line("CONFIG_SELECTED", config_info),
+                self._format_log_line("PROJECT_INFO", project_info),
+                self._format_log_line("SECTION_INFO", section_info),
+                self._format_log_line("TASK_INFO", task_info),
+                self._format_log_line("REPO_INFO", repo_info),
+                self._format_log_line(
+                    "BRANCH_INFO", f"{base_branch_info} | {feature_branch_info}"
+                ),
+                f"{separator}\n",
+            ]
+        )
 
     # Función para registrar el fin del programa
     def log_program_end(self) -> None:
         """
         Registra el fin del programa
         """
+        self._append_to_log(self._format_program_end(), "No se pudo escribir el log de fin")
+
+    # Función para dar formato al bloque de fin del programa
+    def _format_program_end(self) -> str:
+        """
+        Arma el bloque de fin del programa en un solo texto
+        @return {str}: Bloque de fin listo para escribir
+        """
         separator = "=" * 80
         end_message = f"🏁 FIN DEL PROGRAMA GIT"
-
-        log_file_path = self._get_log_file_path()
-        try:
-            with open(log_file_path, "a", encoding="utf-8") as log_file:
-                log_file.write(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] {end_message}\n"
-                )
-                log_file.write(f"{separator}\n\n")
-        except Exception as e:
-            print(f"⚠️ No se pudo escribir el log de fin: {e}")
+        return f"{self._format_log_line(end_message)}{separator}\n\n"
 
     # Función para obtener la ruta del archivo de log de hoy
     def get_today_log_path(self) -> str:
@@ -0,0 +1,163 @@
+import atexit
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.git.GitLogClass import GitLogClass
+from src.types.configTypes import ExtendedConfigType, LogStatus, LOG_INFO
+
+
+# Tarea de escritura pendiente: (ruta, registro ya armado) o un evento de vaciado
+LogTask = Union[Tuple[str, str], threading.Event]
+
+
+# Clase de logs que encola las escrituras y las realiza en un hilo aparte
+class GitQueueLogClass(GitLogClass):
+
+    # Sin atributos de instancia propios; la cola y el escritor son de la clase
+    __slots__ = ()
+
+    # Cola y escritor compartidos por todas las instancias (una por configuración)
+    _queue: "queue.SimpleQueue[LogTask]" = queue.SimpleQueue()
+    _writer: Optional[threading.Thread] = None
+    # Bytes máximos que se acumulan antes de escribir un lote
+    BATCH_BYTES: int = 64 * 1024
+
+    # Constructor de la clase
+    def __init__(self, repo_path: str):
+        """
+        Inicializa la clase de logs y el hilo escritor si aún no existe
+        @param {str} repo_path: Ruta del repositorio
+        """
+        super().__init__(repo_path)
+        self._ensure_writer()
+
+    # Función para arrancar el hilo escritor una sola vez
+    @classmethod
+    def _ensure_writer(cls) -> None:
+        """
+        Arranca el hilo que vacía la cola y registra el vaciado al salir
+        """
+        if cls._writer is not None:
+            return
+        cls._writer = threading.Thread(
+            target=cls._drain_queue, name="GitQueueLogWriter", daemon=True
+        )
+        cls._writer.start()
+        atexit.register(cls.flush)
+
+    # Función que procesa las escrituras pendientes en segundo plano
+    @classmethod
+    def _drain_queue(cls) -> None:
+        """
+        Toma en lotes las escrituras encoladas y las procesa en orden
+        """
+        while True:
+            batch: List[LogTask] = [cls._queue.get()]
+            batch_bytes = 0
+            # Se suman las tareas que ya esperan en la cola sin bloquear
+            while batch_bytes < cls.BATCH_BYTES:
+                try:
+                    task = cls._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(task)
+                if not isinstance(task, threading.Event):
+                    batch_bytes += len(task[1])
+            cls._process_batch(batch)
+
+    # Función para procesar un lote de escrituras
+    @classmethod
+    def _process_batch(cls, batch: List[LogTask]) -> None:
+        """
+        Agrupa los registros por archivo y los escribe con una sola llamada,
+        avisando a cada evento de vaciado cuando lo anterior ya se escribió
+        @param {List[LogTask]} batch: Tareas a procesar
+        """
+        pending: Dict[str, List[str]] = {}
+        for task in batch:
+            if isinstance(task, threading.Event):
+                cls._write_pending(pending)
+                task.set()
+            else:
+                pending.setdefault(task[0], []).append(task[1])
+        cls._write_pending(pending)
+
+    # Función para escribir las líneas acumuladas
+    @staticmethod
+    def _write_pending(pending: Dict[str, List[str]]) -> None:
+        """
+        Escribe los registros acumulados de cada archivo y vacía el acumulado
+        @param {Dict[str, List[str]]} pending: Registros por ruta de archivo
+        """
+        for log_file_path, lines in pending.items():
+            try:
+                with open(log_file_path, "a", encoding="utf-8") as log_file:
+                    log_file.write("".join(lines))
+            except Exception as e:
+                # Un fallo al escribir no debe detener el hilo escritor
+                print(f"⚠️ No se pudo escribir en el log: {e}")
+        pending.clear()
+
+    # Función para esperar a que se escriban los logs pendientes
+    @classmethod
+    def flush(cls, timeout: float = 5.0) -> None:
+        """
+        Espera a que la cola de escrituras quede vacía
+        @param {float} timeout: Segundos máximos de espera
+        """
+        if cls._writer is None:
+            return
+        done = threading.Event()
+        cls._queue.put(done)
+        done.wait(timeout)
+
+    # Función para registrar una operación en el log diario
+    def log_operation(
+        self, operation: str, details: str = "", status: "LogStatus" = LOG_INFO
+    ) -> None:
+        """
+        Encola el registro de una operación en el log diario
+        @param {str} operation: Nombre de la operación
+        @param {str} details: Detalles adicionales
+        @param {LogStatus} status: Estado de la operación (INFO, SUCCESS, WARNING, ERROR)
+        """
+        # La línea se arma aquí para conservar la hora real de la operación
+        self._queue.put(
+            (self._get_log_file_path(), self._format_log_line(operation, details, status))
+        )
+
+    # Función para encolar una operación INFO en el log diario
+    def log_operation_info(self, operation: str, details: str = "") -> None:
+        """
+        Encola el registro de una operación INFO en el log diario
+        @param {str} operation: Nombre de la operación
+        @param {str} details: Detalles adicionales
+        """
+        self._queue.put(
+            (self._get_log_file_path(), self._format_info_line(operation, details))
+        )
+
+    # Función para registrar el inicio del programa con la configuración seleccionada
+    def log_program_start(self, config: "ExtendedConfigType") -> None:
+        """
+        Encola el registro del inicio del programa
+        @param {ExtendedConfigType} config: Configuración seleccionada
+        """
+        self._queue.put((self._get_log_file_path(), self._format_program_start(config)))
+
+    # Función para registrar el fin del programa
+    def log_program_end(self) -> None:
+        """
+        Encola el registro del fin del programa
+        """
+        self._queue.put((self._get_log_file_path(), self._format_program_end()))
+
+    # Función para leer el contenido del log de hoy
+    def read_today_log(self) -> str:
+        """
+        Lee el contenido del log de hoy tras escribir lo pendiente
+        @return {str}: Contenido del log
+        """
+        self.flush()
+        return super().read_today_log()
@@ -1,5 +1,5 @@
 from typing import List
-from src.types.configTypes import MenuOptionType
+from src.types.configTypes import MenuOption
 
 
 class GitAbortManager:
@@ -16,19 +16,19 @@ class GitAbortManager:
         self.colors.info("\n🟥 MENÚ DE CANCELACIÓN DE OPERACIONES")
         self.colors.info("=" * 60)
         
-        options: List["MenuOptionType"] = [
-            {
-                "function": self.abort_merge,
-                "description": "🔴 Cancelar merge en progreso",
-            },
-            {
-                "function": self.abort_rebase,
-                "description": "🔴 Cancelar rebase en progreso",
-            },
-            {
-                "function": self.abort_cherry_pick,
-                "description": "🔴 Cancelar cherry-pick en progreso",
-            },
+        options: List["MenuOption"] = [
+            MenuOption(
+                function=self.abort_merge,
+                description="🔴 Cancelar merge en progreso",
+            ),
+            MenuOption(
+                function=self.abort_rebase,
+                description="🔴 Cancelar rebase en progreso",
+            ),
+            MenuOption(
+                function=self.abort_cherry_pick,
+                description="🔴 Cancelar cherry-pick en progreso",
+            ),
         ]
         
         self.git.show_menu(options, is_submenu=True)
@@ -37,9 +37,11 @@ class GitAbortManager:
         """Cancela un merge en progreso"""
         self.git.ask_pass()
 
-        abort_result = self.git.run_git_command("git merge --abort", allow_failure=True)
+        abort_result = None
+        if self.git.is_operation_in_progress("merge"):
+            abort_result = self.git.run_git_command_check("git merge --abort", allow_failure=True)
 
-        if abort_result["returncode"] == 0:
+        if abort_result is not None and abort_result.returncode == 0:
             self.colors.success("✅ Merge cancelado exitosamente.")
             self.git_logger.log_operation(
                 "MERGE_ABORT", "Merge cancelado", "SUCCESS"
@@ -54,9 +56,11 @@ class GitAbortManager:
         """Cancela un rebase en progreso"""
         self.git.ask_pass()
 
-        abort_result = self.git.run_git_command("git rebase --abort", allow_failure=True)
+        abort_result = None
+        if self.git.is_operation_in_progress("rebase"):
+            abort_result = self.git.run_git_command_check("git rebase --abort", allow_failure=True)
 
-        if abort_result["returncode"] == 0:
+        if abort_result is not None and abort_result.returncode == 0:
             self.colors.success("✅ Rebase cancelado exitosamente.")
             self.git_logger.log_operation(
                 "REBASE_ABORT", "Rebase cancelado", "SUCCESS"
@@ -71,9 +75,11 @@ class GitAbortManager:
         """Cancela un cherry-pick en progreso"""
         self.git.ask_pass()
 
-        abort_result = self.git.run_git_command("git cherry-pick --abort", allow_failure=True)
+        abort_result = None
+        if self.git.is_operation_in_progress("cherry-pick"):
+            abort_result = self.git.run_git_command_check("git cherry-pick --abort", allow_failure=True)
 
-        if abort_result["returncode"] == 0:
+        if abort_result is not None and abort_result.returncode == 0:
             self.colors.success("✅ Cherry-pick cancelado exitosamente.")
             self.git_logger.log_operation(
                 "CHERRY_PICK_ABORT", "Cherry-pick cancelado", "SUCCESS"
@@ -1,11 +1,21 @@
+import io
 import sys
-from typing import Optional, List, TYPE_CHECKING
+from functools import partial
+from typing import Callable, Dict, Optional, List, Tuple, TYPE_CHECKING
 from colorama import Fore
 
 if TYPE_CHECKING:
     from src.types.configTypes import GitCommandResult
 
 
+# Ramas que no se ofrecen para eliminar (comparadas en minúsculas)
+_PROTECTED_BRANCHES = frozenset({"main", "master", "develop", "development"})
+
+# Resultados de las opciones del menú de checkout con cambios pendientes
+_KEEP_PROMPTING = object()
+_DONE = object()
+
+
 class GitBranchManager:
     """Clase para manejar operaciones relacionadas con ramas Git"""
 
@@ -45,31 +55,56 @@ class GitBranchManager:
                 )
             sys.exit(1)
 
+    def _probe_branch_state(self, target_branch: str) -> Tuple[str, bool, bool]:
+        """
+        Obtiene la rama actual y, con un solo for-each-ref, si la rama objetivo
+        existe localmente y/o como referencia remota (origin)
+
+        Returns:
+            Tupla (rama actual, existe local, existe en remoto)
+        """
+        current_branch = self.git.get_current_branch_name()
+
+        local_ref = f"refs/heads/{target_branch}"
+        remote_ref = f"refs/remotes/origin/{target_branch}"
+        refs = set()
+
+        # Se consulta solo la rama objetivo; la salida se lee sin mostrarla
+        self.git.run_git_command_stream(
+            ["git", "for-each-ref", "--format=%(refname)", local_ref, remote_ref],
+            line_handler=lambda line: refs.add(line.strip()),
+        )
+
+        # for-each-ref también lista sub-rutas (rama/x), se compara exacto
+        return current_branch, local_ref in refs, remote_ref in refs
+
     def auto_checkout_to_feature_branch(self) -> None:
         """Intenta cambiar automáticamente a la rama feature configurada"""
         try:
-            result = self.git.run_git_command(
-                "git branch --show-current", allow_failure=True
-            )
-            current_branch = result["stdout"].strip()
-
             target_branch = self.feature_branch.strip() if self.feature_branch else ""
 
+            current_branch, has_local, has_remote = self._probe_branch_state(
+                target_branch
+            )
+
             if current_branch == target_branch:
                 self.colors.success(
                     f"Ya estás en la rama feature: {Fore.YELLOW}{target_branch}{Fore.RESET}"
                 )
                 return
 
-            check_local = self.git.run_git_command(
-                f"git show-ref --verify --quiet refs/heads/{target_branch}",
-                allow_failure=True,
-            )
-
-            if check_local["returncode"] == 0:
+            if has_local:
                 self._checkout_existing_branch(current_branch, target_branch)
-            else:
+            elif has_remote:
                 self._check_remote_branch(current_branch)
+            elif target_branch in self.git.list_remote_heads():
+                # Existe en remoto pero aún no se ha descargado su referencia
+                self.git.run_git_command_check(
+                    ["git", "fetch", "origin", target_branch], allow_failure=True
+                )
+                self._check_remote_branch(current_branch)
+            else:
+                self._show_new_task_info(current_branch)
 
         except Exception as e:
             self.colors.warning(f"Error al verificar rama: {str(e)}")
@@ -80,11 +115,11 @@ class GitBranchManager:
         self.colors.info(
             f" Cambiando a la rama feature: {Fore.YELLOW}{target_branch}{Fore.RESET}"
         )
-        checkout_result = self.git.run_git_command(
-            f"git checkout {target_branch}", allow_failure=True
+        checkout_result = self.git.run_git_command_check(
+            ["git", "checkout", target_branch], allow_failure=True
         )
 
-        if checkout_result["returncode"] == 0:
+        if checkout_result.returncode == 0:
             self.colors.success(
                 f"Posicionado en la rama: {Fore.YELLOW}{target_branch}{Fore.RESET}"
             )
@@ -94,86 +129,100 @@ class GitBranchManager:
                 "SUCCESS",
             )
         else:
-            status_check = self.git.run_git_command("git status --porcelain", allow_failure=True)
-            if status_check["stdout"].strip():
-                self._handle_checkout_with_changes(current_branch, target_branch, checkout_result)
+            status_output = self.git.get_worktree_changes()
+            if status_output:
+                self._handle_checkout_with_changes(
+                    current_branch, target_branch, checkout_result, status_output
+                )
             else:
                 self.colors.warning(
                     f"No se pudo cambiar a la rama {target_branch}"
                 )
-                self.colors.error(f"Error específico: {checkout_result.get('stderr', 'Sin error específico')}")
+                self.colors.error(f"Error específico: {checkout_result.stderr or 'Sin error específico'}")
                 self.colors.info(
                     f"📍 Permaneciendo en: {Fore.CYAN}{current_branch}{Fore.RESET}"
                 )
                 
                 self.git_logger.log_operation(
                     "AUTO_CHECKOUT",
-                    f"Error al cambiar a {target_branch}: {checkout_result.get('stderr', '')}",
+                    f"Error al cambiar a {target_branch}: {checkout_result.stderr}",
                     "ERROR",
                 )
 
-    def _handle_checkout_with_changes(self, current_branch: str, target_branch: str, checkout_result: "GitCommandResult") -> None:
+    def _handle_checkout_with_changes(
+        self,
+        current_branch: str,
+        target_branch: str,
+        checkout_result: "GitCommandResult",
+        status_output: str,
+    ) -> None:
         """Maneja el checkout cuando hay cambios locales pendientes"""
         self.colors.warning("Tienes cambios sin commitear que impiden el checkout:")
-        self.git.run_git_command("git status --short")
+        self.colors.block(f"{status_output}\n")
         
-        self.colors.info("\n Opciones disponibles:")
-        self.colors.info("  1.  Guardar cambios temporalmente (stash) y cambiar de rama")
-        self.colors.info("  2. 📍 Permanecer en la rama actual y continuar")
-        self.colors.info("  3.  Ver detalles de los cambios antes de decidir")
+        options = io.StringIO()
+        options.write(self.colors.info_line("\n Opciones disponibles:"))
+        options.write(self.colors.info_line("  1.  Guardar cambios temporalmente (stash) y cambiar de rama"))
+        options.write(self.colors.info_line("  2. 📍 Permanecer en la rama actual y continuar"))
+        options.write(self.colors.info_line("  3.  Ver detalles de los cambios antes de decidir"))
+        self.colors.block(options.getvalue())
         
+        choices: Dict[str, Callable[[], object]] = {
+            "1": partial(self._choice_stash_and_checkout, current_branch, target_branch),
+            "2": partial(self._choice_stay, current_branch),
+            "3": self._choice_preview_changes,
+        }
+
         while True:
             try:
                 choice = input("\n🔍 Selecciona una opción (1-3): ").strip()
-                
-                if choice == "1":
-                    if self._stash_and_checkout(current_branch, target_branch):
-                        return
-                    else:
-                        break
-                        
-                elif choice == "2":
-                    self.colors.info(f"📍 Permaneciendo en: {Fore.CYAN}{current_branch}{Fore.RESET}")
-                    self.git_logger.log_operation(
-                        "AUTO_CHECKOUT",
-                        f"Usuario decidió permanecer en {current_branch}",
-                        "INFO",
-                    )
-                    return
-                    
-                elif choice == "3":
-                    self.colors.info(" Detalles de los cambios:")
-                    self.git.run_git_command("git diff --name-status")
-                    self.colors.info("\n Vista previa de cambios:")
-                    self.git.run_git_command("git diff --stat")
-                    continue
-                    
-                else:
-                    self.colors.warning("Opción inválida. Selecciona 1, 2 o 3.")
-                    continue
-                    
             except KeyboardInterrupt:
                 self.colors.info(f"\n📍 Permaneciendo en: {Fore.CYAN}{current_branch}{Fore.RESET}")
                 return
-        
+
+            handler = choices.get(choice)
+            if handler is None:
+                self.colors.warning("Opción inválida. Selecciona 1, 2 o 3.")
+            elif handler() is _DONE:
+                return
+
+    def _choice_stash_and_checkout(self, current_branch: str, target_branch: str) -> object:
+        """Opción 1: guarda los cambios con stash y cambia de rama"""
+        if not self._stash_and_checkout(current_branch, target_branch):
+            self.colors.info(f"📍 Permaneciendo en: {Fore.CYAN}{current_branch}{Fore.RESET}")
+        return _DONE
+
+    def _choice_stay(self, current_branch: str) -> object:
+        """Opción 2: permanece en la rama actual"""
         self.colors.info(f"📍 Permaneciendo en: {Fore.CYAN}{current_branch}{Fore.RESET}")
+        self.git_logger.log_operation_info(
+            "AUTO_CHECKOUT",
+            f"Usuario decidió permanecer en {current_branch}",
+        )
+        return _DONE
+
+    def _choice_preview_changes(self) -> object:
+        """Opción 3: muestra los detalles de los cambios y vuelve a preguntar"""
+        self.colors.info(" Detalles de los cambios:")
+        self.git.run_git_command_stream(["git", "--no-pager", "diff", "--stat", "--summary"])
+        return _KEEP_PROMPTING
 
     def _stash_and_checkout(self, current_branch: str, target_branch: str) -> bool:
         """Guarda cambios con stash y hace checkout"""
         try:
-            from src.git.managers.GitStashManager import GitStashManager
-            stash_manager = GitStashManager(self.git)
+            # Se reutiliza el gestor de stash compartido de GitClass
+            stash_manager = self.git.stash_manager
             
             self.colors.info(" Guardando cambios temporalmente...")
             stash_manager.save_changes_locally()
             
             self.colors.info(f" Cambiando a {Fore.YELLOW}{target_branch}{Fore.RESET}...")
-            checkout_result = self.git.run_git_command(
-                f"git checkout {target_branch}", 
+            checkout_result = self.git.run_git_command_check(
+                ["git", "checkout", target_branch],
                 allow_failure=True
             )
             
-            if checkout_result["returncode"] == 0:
+            if checkout_result.returncode == 0:
                 self.colors.success(f"Posicionado en: {Fore.YELLOW}{target_branch}{Fore.RESET}")
                 self.colors.info(f" Tus cambios están guardados en stash. Usa la opción del menú para restaurarlos.")
                 
@@ -194,46 +243,39 @@ class GitBranchManager:
             return False
 
     def _check_remote_branch(self, current_branch: str) -> None:
-        """Verifica si la rama existe en remoto y la descarga si es posible"""
-        check_remote = self.git.run_git_command(
-            f"git ls-remote --heads origin {self.feature_branch}", allow_failure=True
+        """Descarga la rama feature que ya se sabe existente en remoto"""
+        self.colors.info(
+            f" La rama {Fore.YELLOW}{self.feature_branch}{Fore.RESET} existe en remoto. Descargando..."
         )
 
-        if check_remote["stdout"].strip():
-            self.colors.info(
-                f" La rama {Fore.YELLOW}{self.feature_branch}{Fore.RESET} existe en remoto. Descargando..."
-            )
+        checkout_remote = self.git.run_git_command_check(
+            ["git", "checkout", "-b", self.feature_branch, f"origin/{self.feature_branch}"],
+            allow_failure=True,
+        )
 
-            checkout_remote = self.git.run_git_command(
-                f"git checkout -b {self.feature_branch} origin/{self.feature_branch}",
+        if checkout_remote.returncode == 0:
+            self.colors.success(
+                f"Rama descargada y posicionado en: {Fore.YELLOW}{self.feature_branch}{Fore.RESET}"
+            )
+            self.git_logger.log_operation(
+                "AUTO_CHECKOUT_REMOTE",
+                f"Descarga y cambio a {self.feature_branch} desde remoto",
+                "SUCCESS",
+            )
+        else:
+            track_result = self.git.run_git_command_check(
+                ["git", "checkout", "--track", f"origin/{self.feature_branch}"],
                 allow_failure=True,
             )
-
-            if checkout_remote["returncode"] == 0:
+            if track_result.returncode == 0:
                 self.colors.success(
-                    f"Rama descargada y posicionado en: {Fore.YELLOW}{self.feature_branch}{Fore.RESET}"
-                )
-                self.git_logger.log_operation(
-                    "AUTO_CHECKOUT_REMOTE",
-                    f"Descarga y cambio a {self.feature_branch} desde remoto",
-                    "SUCCESS",
+                    f"Rama rastreada: {Fore.YELLOW}{self.feature_branch}{Fore.RESET}"
                 )
             else:
-                track_result = self.git.run_git_command(
-                    f"git checkout --track origin/{self.feature_branch}",
-                    allow_failure=True,
+                self.colors.warning(f"No se pudo descargar la rama remota")
+                self.colors.info(
+                    f"📍 Permaneciendo en: {Fore.CYAN}{current_branch}{Fore.RESET}"
                 )
-                if track_result["returncode"] == 0:
-                    self.colors.success(
-                        f"Rama rastreada: {Fore.YELLOW}{self.feature_branch}{Fore.RESET}"
-                    )
-                else:
-                    self.colors.warning(f"No se pudo descargar la rama remota")
-                    self.colors.info(
-                        f"📍 Permaneciendo en: {Fore.CYAN}{current_branch}{Fore.RESET}"
-                    )
-        else:
-            self._show_new_task_info(current_branch)
 
     def _show_new_task_info(self, current_branch: str) -> None:
         """Muestra información cuando se detecta una nueva tarea"""
@@ -249,35 +291,26 @@ class GitBranchManager:
             "   Usa la opción 6 del menú para crear la rama cuando estés listo."
         )
         self.colors.info("━" * 60)
-        self.git_logger.log_operation(
+        self.git_logger.log_operation_info(
             "NEW_TASK_DETECTED",
             f"Nueva tarea detectada: {self.feature_branch} no existe",
-            "INFO",
         )
 
     def get_current_branch(self) -> None:
         """Muestra todas las ramas y marca la actual"""
-        self.git.run_git_command("git branch")
+        self.git.run_git_command_stream(["git", "--no-pager", "branch"])
 
     def create_branch_feature(self) -> None:
         """Crea una nueva rama feature desde la rama actual"""
         self.git.ask_pass()
 
-        local_check = self.git.run_git_command(
-            f"git rev-parse --verify --quiet {self.feature_branch}", allow_failure=True
-        )
-
-        if local_check["returncode"] == 0:
+        if self.feature_branch in self.git.list_local_heads():
             self.colors.warning(
                 f"La rama '{self.feature_branch}' ya existe localmente."
             )
             return
 
-        remote_check = self.git.run_git_command(
-            f"git ls-remote --heads origin {self.feature_branch}", allow_failure=True
-        )
-
-        if remote_check["stdout"].strip():
+        if self.feature_branch in self.git.list_remote_heads():
             self.colors.warning(
                 f"La rama '{self.feature_branch}' ya existe en remoto."
             )
@@ -285,18 +318,18 @@ class GitBranchManager:
             return
 
         self.colors.info(f" Creando nueva rama: {self.feature_branch}")
-        create_result = self.git.run_git_command(
-            f"git checkout -b {self.feature_branch}", allow_failure=True
+        create_result = self.git.run_git_command_check(
+            ["git", "checkout", "-b", self.feature_branch], allow_failure=True
         )
 
-        if create_result["returncode"] == 0:
+        if create_result.returncode == 0:
             self.colors.success(f"Rama '{self.feature_branch}' creada exitosamente.")
             self.git_logger.log_branch_operation(
                 "create", self.feature_branch, "SUCCESS"
             )
         else:
             self.colors.error(
-                f"Error al crear la rama: {create_result.get('stderr', '')}"
+                f"Error al crear la rama: {create_result.stderr}"
             )
             self.git_logger.log_branch_operation(
                 "create", self.feature_branch, "ERROR"
@@ -306,69 +339,80 @@ class GitBranchManager:
         """Elimina una rama específica con menú interactivo"""
         self.git.ask_pass()
 
-        branches_result = self.git.run_git_command("git branch", allow_failure=True)
-        if branches_result["returncode"] != 0:
+        branches_result = self.git.run_git_command(
+            ["git", "for-each-ref", "--format=%(HEAD) %(refname:short)", "refs/heads/"],
+            allow_failure=True,
+            echo_output=False,
+        )
+        if branches_result.returncode != 0:
             self.colors.error("Error al obtener las ramas locales.")
             return
 
         all_branches: List[str] = []
         current_branch: str = ""
 
-        for line in branches_result["stdout"].split("\n"):
-            line = line.strip()
-            if line:
-                if line.startswith("* "):
-                    current_branch = line[2:].strip()
-                    all_branches.append(current_branch)
-                else:
-                    all_branches.append(line.strip())
-
-        deletable_branches: List[str] = []
-        protected_branches = ["main", "master", "develop", "development"]
-
-        for branch in all_branches:
-            if branch != current_branch and branch.lower() not in protected_branches:
-                deletable_branches.append(branch)
+        # %(HEAD) marca con "*" la rama actual y con espacio el resto
+        for line in branches_result.stdout.splitlines():
+            if line.startswith("* "):
+                current_branch = line[2:]
+                all_branches.append(current_branch)
+            elif line.strip():
+                all_branches.append(line.strip())
+
+        deletable_branches: List[str] = [
+            branch
+            for branch in all_branches
+            if branch != current_branch
+            and branch.casefold() not in _PROTECTED_BRANCHES
+        ]
 
         if not deletable_branches:
             self.colors.warning("No hay ramas disponibles para eliminar.")
             self.colors.info(f"📍 Rama actual: {Fore.CYAN}{current_branch}{Fore.RESET}")
             return
 
-        self.colors.info("🗑️ SELECCIONAR RAMA PARA ELIMINAR")
-        self.colors.info("━" * 50)
-        self.colors.info(f"📍 Rama actual: {Fore.CYAN}{current_branch}{Fore.RESET}")
-        self.colors.info("━" * 50)
+        menu = io.StringIO()
+        menu.write(self.colors.info_line("🗑️ SELECCIONAR RAMA PARA ELIMINAR"))
+        menu.write(self.colors.info_line("━" * 50))
+        menu.write(self.colors.info_line(f"📍 Rama actual: {Fore.CYAN}{current_branch}{Fore.RESET}"))
+        menu.write(self.colors.info_line("━" * 50))
 
         for i, branch in enumerate(deletable_branches, 1):
-            self.colors.info(f"  {i}. {Fore.YELLOW}{branch}{Fore.RESET}")
+            menu.write(self.colors.info_line(f"  {i}. {Fore.YELLOW}{branch}{Fore.RESET}"))
 
-        self.colors.info(
+        menu.write(self.colors.info_line(
             f"  {len(deletable_branches) + 1}.  Escribir otra rama manualmente"
-        )
-        self.colors.info(f"  {len(deletable_branches) + 2}. Salir")
-        self.colors.info("━" * 50)
+        ))
+        menu.write(self.colors.info_line(f"  {len(deletable_branches) + 2}. Salir"))
+        menu.write(self.colors.info_line("━" * 50))
+        self.colors.block(menu.getvalue())
 
         try:
-            choice = input(" Selecciona una opción (número): ").strip()
+            choice = input(
+                " Selecciona una opción (número, o varios separados por comas): "
+            ).strip()
             if not choice:
                 self.colors.warning("No se seleccionó ninguna opción.")
                 return
 
-            choice_num = int(choice)
+            choice_nums = [int(part) for part in choice.replace(",", " ").split()]
 
-            if choice_num == len(deletable_branches) + 2:
+            if choice_nums == [len(deletable_branches) + 2]:
                 self.colors.info("Operación cancelada.")
                 return
 
-            elif choice_num == len(deletable_branches) + 1:
+            elif choice_nums == [len(deletable_branches) + 1]:
                 branch_name = input(" Nombre de la rama a eliminar: ").strip()
                 if not branch_name:
                     self.colors.warning(" No se especificó ninguna rama.")
                     return
+                branch_names = [branch_name]
 
-            elif 1 <= choice_num <= len(deletable_branches):
-                branch_name = deletable_branches[choice_num - 1]
+            elif all(1 <= num <= len(deletable_branches) for num in choice_nums):
+                # dict.fromkeys quita repetidos conservando el orden elegido
+                branch_names = list(
+                    dict.fromkeys(deletable_branches[num - 1] for num in choice_nums)
+                )
 
             else:
                 self.colors.error("Opción inválida.")
@@ -378,37 +422,65 @@ class GitBranchManager:
             self.colors.error("Debes introducir un número válido.")
             return
 
-        self.git_logger.log_user_input("branch_to_delete", branch_name)
+        self.git_logger.log_user_input("branch_to_delete", ", ".join(branch_names))
 
-        if branch_name == current_branch:
+        if current_branch in branch_names:
             self.colors.error("No puedes eliminar la rama en la que estás.")
             return
 
-        if branch_name.lower() in protected_branches:
-            if not self.git.confirm_action(
-                f"'{branch_name}' es una rama protegida. ¿Seguro que deseas eliminarla?"
-            ):
-                return
+        for branch_name in branch_names:
+            if branch_name.casefold() in _PROTECTED_BRANCHES:
+                if not self.git.confirm_action(
+                    f"'{branch_name}' es una rama protegida. ¿Seguro que deseas eliminarla?"
+                ):
+                    return
 
+        branches_label = ", ".join(
+            f"{Fore.YELLOW}{branch_name}{Fore.RESET}" for branch_name in branch_names
+        )
         self.colors.warning(
-            f"Vas a eliminar la rama: {Fore.YELLOW}{branch_name}{Fore.RESET}"
+            f"Vas a eliminar {'la rama' if len(branch_names) == 1 else 'las ramas'}: {branches_label}"
         )
         if not self.git.confirm_action("¿Continuar con la eliminación?"):
             self.colors.info("Eliminación cancelada.")
             return
 
-        delete_result = self.git.run_git_command(
-            f"git branch -D {branch_name}", allow_failure=True
+        # Un solo git branch -D para todas las ramas elegidas
+        delete_result = self.git.run_git_command_check(
+            ["git", "branch", "-D", *branch_names], allow_failure=True
         )
 
-        if delete_result["returncode"] == 0:
-            self.colors.success(f"Rama '{branch_name}' eliminada localmente.")
+        if delete_result.returncode == 0:
+            for branch_name in branch_names:
+                self.colors.success(f"Rama '{branch_name}' eliminada localmente.")
+                self.git_logger.log_branch_operation("delete", branch_name, "SUCCESS")
             self.colors.info(
                 "Solo se eliminó la rama local, el remoto no fue afectado."
             )
-            self.git_logger.log_branch_operation("delete", branch_name, "SUCCESS")
         else:
             self.colors.error(
-                f"Error al eliminar la rama: {delete_result.get('stderr', '')}"
+                f"Error al eliminar la rama: {delete_result.stderr}"
+            )
+            # git branch -D borra las que puede aunque falle alguna; se revisa cuáles quedan
+            self.git.local_refs_cache = None
+            remaining_refs = set()
+            refs_returncode = self.git.run_git_command_stream(
+                [
+                    "git", "for-each-ref", "--format=%(refname)",
+                    *(f"refs/heads/{branch_name}" for branch_name in branch_names),
+                ],
+                line_handler=lambda line: remaining_refs.add(line.strip()),
             )
-            self.git_logger.log_branch_operation("delete", branch_name, "ERROR")
+            for branch_name in branch_names:
+                if refs_returncode != 0:
+                    # Sin poder releer las ramas no se sabe cuáles se eliminaron
+                    self.colors.warning(
+                        f"No se pudo comprobar si se eliminó la rama '{branch_name}'."
+                    )
+                    self.git_logger.log_branch_operation("delete", branch_name, "UNKNOWN")
+                elif f"refs/heads/{branch_name}" in remaining_refs:
+                    self.colors.error(f"No se eliminó la rama '{branch_name}'.")
+                    self.git_logger.log_branch_operation("delete", branch_name, "ERROR")
+                else:
+                    self.colors.success(f"Rama '{branch_name}' eliminada localmente.")
+                    self.git_logger.log_branch_operation("delete", branch_name, "SUCCESS")
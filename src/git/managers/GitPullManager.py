@@ -20,8 +20,7 @@ class GitPullManager:
         self.git.ask_pass()
 
         try:
-            branch_result = self.git.run_git_command("git branch --show-current")
-            current_branch = branch_result["stdout"].strip()
+            current_branch = self.git.get_current_branch_name()
 
             self.colors.info(
                 f" Rama actual: {Fore.YELLOW}{current_branch}{Fore.RESET}"
@@ -32,25 +31,19 @@ class GitPullManager:
                 self.colors.info(" Usa REBASE para integrar cambios a tu feature.")
                 return
 
-            remote_check = self.git.run_git_command(
-                f"git ls-remote --heads origin {current_branch}", allow_failure=True
-            )
-
-            if not remote_check["stdout"].strip():
+            if current_branch not in self.git.list_remote_heads():
                 self.colors.warning(f"La rama {current_branch} no existe en remoto.")
                 self.colors.info(" Creando rama en remoto...")
-                self.git.run_git_command(f"git push --set-upstream origin {current_branch}")
+                self.git.run_git_command_check(
+                    ["git", "push", "--set-upstream", "origin", current_branch]
+                )
                 self.colors.success(f"Rama {current_branch} publicada.")
                 return
 
-            status = self.git.run_git_command("git status --porcelain")
-            has_changes = bool(status["stdout"].strip())
-
-            if has_changes:
+            if self.git.is_worktree_dirty():
                 self.colors.warning("Hay cambios locales sin commitear.")
                 if self.git.confirm_action("¿Guardar cambios antes del pull?"):
-                    from src.git.managers.GitStashManager import GitStashManager
-                    stash_manager = GitStashManager(self.git)
+                    stash_manager = self.git.stash_manager
                     stash_manager.save_changes_locally()
                     self._do_pull(current_branch)
                     stash_manager.restore_local_changes()
@@ -72,17 +65,17 @@ class GitPullManager:
                 f"⚡ Pull directo de {Fore.BLUE}{self.base_branch}{Fore.RESET}..."
             )
             
-            pull_result = self.git.run_git_command(
-                f"git pull origin {self.base_branch}", allow_failure=True
+            pull_result = self.git.run_git_command_check(
+                ["git", "pull", "origin", self.base_branch], allow_failure=True
             )
 
-            if pull_result["returncode"] == 0:
+            if pull_result.returncode == 0:
                 self.colors.success(
                     f"PULL EXITOSO: Cambios de {Fore.BLUE}{self.base_branch}{Fore.RESET} descargados"
                 )
                 self.git_logger.log_pull_operation(self.base_branch, "SUCCESS")
             else:
-                error_msg = pull_result.get('stderr', '') or pull_result.get('stdout', '')
+                error_msg = pull_result.stderr
                 self.colors.warning(f"Pull ejecutado con advertencias: {error_msg}")
                 self.git_logger.log_pull_operation(self.base_branch, "WARNING")
 
@@ -92,25 +85,23 @@ class GitPullManager:
 
     def _do_pull(self, branch: str) -> None:
         """Ejecuta el pull con rebase"""
-        pull_result = self.git.run_git_command(
-            f"git pull --rebase origin {branch}", allow_failure=True
+        pull_result = self.git.run_git_command_check(
+            ["git", "pull", "--rebase", "origin", branch], allow_failure=True
         )
 
-        if pull_result["returncode"] == 0:
+        if pull_result.returncode == 0:
             self.colors.success(
                 f"PULL EXITOSO: Cambios descargados en {Fore.YELLOW}{branch}{Fore.RESET}"
             )
             self.git_logger.log_pull_operation(branch, "SUCCESS")
         else:
-            if "CONFLICT" in pull_result.get("stdout", "") + pull_result.get(
-                "stderr", ""
-            ):
+            if self.git.has_unresolved_conflicts():
                 self.colors.error("Hay conflictos durante el pull.")
                 self.colors.info(
                     " Resuelve los conflictos y ejecuta: git rebase --continue"
                 )
             else:
                 self.colors.error(
-                    f"Error durante el pull: {pull_result.get('stderr', '')}"
+                    f"Error durante el pull: {pull_result.stderr}"
                 )
             self.git_logger.log_pull_operation(branch, "ERROR")
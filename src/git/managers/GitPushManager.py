@@ -1,13 +1,16 @@
-from typing import TYPE_CHECKING
+from typing import List, TYPE_CHECKING
 from colorama import Fore
 
 if TYPE_CHECKING:
-    from src.types.configTypes import GitCommandResult
+    from src.types.configTypes import BranchStatusType, GitCommandResult
 
 
 class GitPushManager:
     """Clase para manejar operaciones de push y commit en Git"""
 
+    # Longitud máxima de las rutas pasadas en un solo git add
+    MAX_ARGS_LENGTH: int = 30000
+
     def __init__(self, git_instance):
         """Inicializa el gestor de push con una instancia de GitClass"""
         self.git = git_instance
@@ -19,20 +22,15 @@ class GitPushManager:
         self.git.ask_pass()
 
         try:
-            branch_result = self.git.run_git_command("git branch --show-current")
-            current_branch = branch_result["stdout"].strip()
-
-            status = self.git.run_git_command("git status --porcelain")
-            has_uncommitted_changes = bool(status["stdout"].strip())
-
-            upstream_result = self.git.run_git_command(
-                f"git config branch.{current_branch}.remote", allow_failure=True
-            )
-            has_upstream = upstream_result["returncode"] == 0 and bool(
-                upstream_result["stdout"].strip()
-            )
+            status = self.git.get_branch_status()
+            current_branch = status["branch"]
+            has_uncommitted_changes = bool(status["paths"])
+            has_upstream = status["upstream"] is not None
 
-            commits_to_push = self._count_pending_commits(current_branch, has_upstream)
+            if has_upstream:
+                commits_to_push = status["ahead"]
+            else:
+                commits_to_push = self._count_pending_commits()
 
             if not has_uncommitted_changes and commits_to_push == 0:
                 self.colors.warning(
@@ -41,37 +39,30 @@ class GitPushManager:
                 return
 
             if has_uncommitted_changes:
-                if not self._commit_changes():
+                if not self._commit_changes(status["unstaged"]):
                     return
                 commits_to_push += 1
 
             if commits_to_push > 0:
-                self._push_changes(current_branch, has_upstream, commits_to_push)
+                self._push_changes(status, commits_to_push)
 
         except Exception as e:
             self.colors.error(f"Error al subir cambios: {str(e)}")
             self.git_logger.log_error(str(e), "upload_changes")
 
-    def _count_pending_commits(self, branch: str, has_upstream: bool) -> int:
-        """Cuenta los commits pendientes de push"""
-        if has_upstream:
-            ahead_result = self.git.run_git_command(
-                f"git rev-list --count origin/{branch}..HEAD", allow_failure=True
-            )
-            if ahead_result["returncode"] == 0:
-                return int(ahead_result["stdout"].strip() or 0)
-        else:
-            commit_count = self.git.run_git_command(
-                "git rev-list --count HEAD", allow_failure=True
-            )
-            if commit_count["returncode"] == 0:
-                return int(commit_count["stdout"].strip() or 0)
+    def _count_pending_commits(self) -> int:
+        """Cuenta los commits pendientes de push de una rama sin upstream"""
+        commit_count = self.git.run_git_command(
+            ["git", "rev-list", "--count", "HEAD"], allow_failure=True
+        )
+        if commit_count.returncode == 0:
+            return int(commit_count.stdout.strip() or 0)
         return 0
 
-    def _commit_changes(self) -> bool:
+    def _commit_changes(self, paths: List[str]) -> bool:
         """Realiza commit de los cambios pendientes"""
         self.colors.info(" Cambios detectados sin commitear:")
-        self.git.run_git_command("git status --short")
+        self.git.run_git_command_stream(["git", "status", "--short"])
 
         commit_message = input(" Mensaje del commit: ").strip()
         if not commit_message:
@@ -83,15 +74,37 @@ class GitPushManager:
 
         self.git_logger.log_user_input("commit_message", commit_message)
 
-        self.git.run_git_command("git add .")
-        self.git.run_git_command(f'git commit -m "{commit_message}"')
+        self._stage_paths(paths)
+        self.git.run_git_command_check(["git", "commit", "-m", commit_message])
         self.colors.success("Commit realizado exitosamente.")
         return True
 
+    def _stage_paths(self, paths: List[str]) -> None:
+        """Agrega al índice solo las rutas modificadas, en pocos git add"""
+        if not paths:
+            return
+
+        # Las rutas de status son relativas a la raíz y se toman de forma literal
+        pathspecs = [f":(top,literal){path}" for path in paths]
+
+        # Se agrupan para no pasar del límite de la línea de comandos (32767 en Windows)
+        chunk: List[str] = []
+        chunk_length = 0
+        for pathspec in pathspecs:
+            if chunk and chunk_length + len(pathspec) + 1 > self.MAX_ARGS_LENGTH:
+                self.git.run_git_command_check(["git", "add", "--", *chunk])
+                chunk, chunk_length = [], 0
+            chunk.append(pathspec)
+            chunk_length += len(pathspec) + 1
+        self.git.run_git_command_check(["git", "add", "--", *chunk])
+
     def _push_changes(
-        self, branch: str, has_upstream: bool, commits_count: int
+        self, status: "BranchStatusType", commits_count: int
     ) -> None:
         """Sube los cambios al remoto"""
+        branch = status["branch"]
+        has_upstream = status["upstream"] is not None
+
         self.colors.info(f" Subiendo {commits_count} commit(s) en '{branch}'")
 
         self._show_pending_commits(branch, has_upstream, commits_count)
@@ -99,12 +112,12 @@ class GitPushManager:
         if not has_upstream:
             self._setup_upstream(branch)
         else:
-            if not self._check_sync_before_push(branch):
+            if not self._check_sync_before_push(branch, status["behind"]):
                 return
 
-        push_result = self.git.run_git_command("git push", allow_failure=True)
+        push_result = self.git.run_git_command_check(["git", "push"], allow_failure=True)
 
-        if push_result["returncode"] == 0:
+        if push_result.returncode == 0:
             self._handle_push_success(branch)
         else:
             self._handle_push_error(branch, push_result)
@@ -113,61 +126,53 @@ class GitPushManager:
         self, branch: str, has_upstream: bool, count: int
     ) -> None:
         """Muestra los commits pendientes de push"""
+        self.colors.info(" Commits pendientes:")
         if has_upstream:
-            commits = self.git.run_git_command(
-                f"git log origin/{branch}..HEAD --oneline", allow_failure=True
+            self.git.run_git_command_stream(
+                ["git", "--no-pager", "log", f"origin/{branch}..HEAD", "--oneline"]
             )
         else:
-            commits = self.git.run_git_command(
-                f"git log --oneline -n {min(count, 5)}", allow_failure=True
+            self.git.run_git_command_stream(
+                ["git", "--no-pager", "log", "--oneline", "-n", str(min(count, 5))]
             )
 
-        if commits["returncode"] == 0 and commits["stdout"]:
-            self.colors.info(" Commits pendientes:")
-            print(commits["stdout"])
-
     def _setup_upstream(self, branch: str) -> None:
         """Configura el upstream para una rama"""
         self.colors.info(f"📡 Configurando upstream para '{branch}'...")
 
-        self.git.run_git_command("git fetch origin")
-
-        remote_check = self.git.run_git_command(
-            f"git ls-remote --heads origin {branch}", allow_failure=True
-        )
-
-        if remote_check["stdout"].strip():
+        if branch in self.git.list_remote_heads():
             self.colors.info(f"🔗 La rama existe en remoto. Configurando...")
-            self.git.run_git_command(
-                f"git branch --set-upstream-to=origin/{branch} {branch}"
+            self.git.run_git_command_check(["git", "fetch", "origin"])
+            self.git.run_git_command_check(
+                ["git", "branch", f"--set-upstream-to=origin/{branch}", branch]
             )
         else:
             self.colors.info(f"🆕 Creando rama en remoto...")
-            self.git.run_git_command(f"git push --set-upstream origin {branch}")
+            self.git.run_git_command_check(["git", "push", "--set-upstream", "origin", branch])
 
-    def _check_sync_before_push(self, branch: str) -> bool:
+    def _check_sync_before_push(self, branch: str, behind: int) -> bool:
         """Verifica sincronización antes de hacer push"""
+        # Sin commits por detrás y con un fetch reciente no hace falta volver a consultar
+        if behind == 0 and self.git.fetched_recently():
+            return True
+
         self.colors.info(f" Verificando sincronización de '{branch}'...")
 
-        self.git.run_git_command("git fetch origin")
+        self.git.run_git_command_check(["git", "fetch", "origin"])
 
-        behind = self.git.run_git_command(
-            f"git rev-list --count HEAD..origin/{branch}", allow_failure=True
-        )
+        counts = self.git.ahead_behind(branch)
 
-        if behind["returncode"] == 0:
-            behind_count = int(behind["stdout"].strip() or 0)
+        if counts is not None:
+            _, behind_count = counts
             if behind_count > 0:
                 self.colors.warning(
                     f" Tu rama está {behind_count} commit(s) detrás del remoto."
                 )
 
                 if self.git.confirm_action("¿Hacer pull primero?"):
-                    pull_result = self.git.run_git_command("git pull", allow_failure=True)
+                    pull_result = self.git.run_git_command_check(["git", "pull"], allow_failure=True)
 
-                    if "CONFLICT" in pull_result.get("stdout", "") + pull_result.get(
-                        "stderr", ""
-                    ):
+                    if pull_result.returncode != 0 and self.git.has_unresolved_conflicts():
                         self.colors.error("Hay conflictos. Resuélvelos manualmente.")
                         self.git_logger.log_error(
                             "Conflictos durante pull", "upload_changes"
@@ -180,9 +185,11 @@ class GitPushManager:
         """Maneja el éxito del push"""
         self.colors.success("Cambios subidos exitosamente.")
 
-        last_commit = self.git.run_git_command("git log -1 --oneline", allow_failure=True)
+        last_commit = self.git.run_git_command(
+            ["git", "log", "-1", "--oneline"], allow_failure=True
+        )
         commit_msg = (
-            last_commit["stdout"].strip() if last_commit["stdout"] else "Unknown"
+            last_commit.stdout.strip() if last_commit.stdout else "Unknown"
         )
 
         self.git_logger.log_push_operation(branch, commit_msg, "SUCCESS")
@@ -192,13 +199,15 @@ class GitPushManager:
 
     def _handle_push_error(self, branch: str, result: "GitCommandResult") -> None:
         """Maneja errores de push"""
-        error_msg = result.get("stderr", "")
+        error_msg = result.stderr
 
         if "rejected" in error_msg:
             self.colors.error("Push rechazado. Necesitas hacer pull primero.")
+            # Actualiza las referencias remotas para el siguiente intento
+            self.git.run_git_command_check(["git", "fetch", "origin"], allow_failure=True)
             self.colors.info(f" Intenta: git pull --rebase origin {branch}")
             self.git_logger.log_push_operation(branch, "Push rejected", "WARNING")
-        elif "Everything up-to-date" in result.get("stdout", ""):
+        elif "Everything up-to-date" in error_msg:
             self.colors.info("Todo está actualizado.")
         else:
             self.colors.error(f"Error al hacer push: {error_msg}")
@@ -18,23 +18,22 @@ class GitRebaseManager:
             f" REBASE: Integrando cambios de {Fore.BLUE}{self.base_branch}{Fore.RESET} → {Fore.YELLOW}{self.feature_branch}{Fore.RESET}"
         )
         
-        status = self.git.run_git_command("git status --porcelain", allow_failure=True)
-        has_local_changes = bool(status["stdout"].strip())
+        has_local_changes = bool(self.git.get_status())
         
         stashed = False
         if has_local_changes:
             if self.git.confirm_action("¿Quieres guardar tus cambios locales antes del rebase?"):
-                from src.git.managers.GitStashManager import GitStashManager
-                stash_manager = GitStashManager(self.git)
-                stash_manager.save_changes_locally()
+                self.git.stash_manager.save_changes_locally()
                 stashed = True
         
         try:
             self.colors.info(f" Actualizando {self.base_branch} desde remoto...")
-            self.git.run_git_command(f"git fetch origin {self.base_branch}:{self.base_branch}")
+            self.git.run_git_command_check(
+                ["git", "fetch", "origin", f"{self.base_branch}:{self.base_branch}"]
+            )
             
             self.colors.info(f" Aplicando rebase...")
-            self.git.run_git_command(f"git rebase {self.base_branch}")
+            self.git.run_git_command_check(["git", "rebase", self.base_branch])
             
             self.colors.success("REBASE EXITOSO: Cambios integrados")
             
@@ -43,9 +42,7 @@ class GitRebaseManager:
             
         finally:
             if stashed:
-                from src.git.managers.GitStashManager import GitStashManager
-                stash_manager = GitStashManager(self.git)
-                stash_manager.restore_local_changes()
+                self.git.stash_manager.restore_local_changes()
 
     def get_latest_changes(self) -> None:
         """Hace rebase de la rama base a la rama feature"""
@@ -58,37 +55,34 @@ class GitRebaseManager:
             f" Integrando desde: {Fore.BLUE}{self.base_branch}{Fore.RESET}\n"
         )
 
-        checkout_result = self.git.run_git_command(
-            f"git checkout {self.feature_branch}", allow_failure=True
+        checkout_result = self.git.run_git_command_check(
+            ["git", "checkout", self.feature_branch], allow_failure=True
         )
 
-        if checkout_result["returncode"] != 0:
+        if checkout_result.returncode != 0:
             self.colors.error(f"No se pudo cambiar a la rama {self.feature_branch}")
             return
 
-        self.git.run_git_command("git fetch origin")
-
-        base_check = self.git.run_git_command(
-            f"git rev-parse --verify {self.base_branch}", allow_failure=True
-        )
+        self.git.run_git_command_check("git fetch origin")
 
-        if base_check["returncode"] != 0:
+        if self.git.verify_ref_cached(self.base_branch) is None:
+            # El fetch anterior ya trajo origin/<base>; se crea la rama local sin red
             self.colors.warning(
-                f"Descargando rama base '{self.base_branch}' desde remoto..."
+                f"Creando rama base '{self.base_branch}' desde origin/{self.base_branch}..."
             )
-            fetch_result = self.git.run_git_command(
-                f"git fetch origin {self.base_branch}:{self.base_branch}",
+            branch_result = self.git.run_git_command_check(
+                ["git", "branch", "--track", self.base_branch, f"origin/{self.base_branch}"],
                 allow_failure=True,
             )
-            if fetch_result["returncode"] != 0:
+            if branch_result.returncode != 0:
                 self.colors.error(f"No se pudo obtener la rama '{self.base_branch}'")
                 return
 
-        rebase_result = self.git.run_git_command(
-            f"git rebase {self.base_branch}", allow_failure=True
+        rebase_result = self.git.run_git_command_check(
+            ["git", "rebase", self.base_branch], allow_failure=True
         )
 
-        if rebase_result["returncode"] == 0:
+        if rebase_result.returncode == 0:
             self.colors.success(
                 f"REBASE EXITOSO: Cambios de {Fore.BLUE}{self.base_branch}{Fore.RESET} integrados"
             )
@@ -96,9 +90,7 @@ class GitRebaseManager:
                 self.base_branch, self.feature_branch, "SUCCESS"
             )
         else:
-            if "CONFLICT" in rebase_result.get("stdout", "") + rebase_result.get(
-                "stderr", ""
-            ):
+            if self.git.has_unresolved_conflicts():
                 self.colors.error("Hay conflictos durante el rebase.")
                 self.colors.info(" Resuelve los conflictos y ejecuta:")
                 self.colors.info("   git add <archivos resueltos>")
@@ -106,7 +98,7 @@ class GitRebaseManager:
                 self.colors.info("   O usa la opción 9 para cancelar el rebase")
             else:
                 self.colors.error(
-                    f"Error durante el rebase: {rebase_result.get('stderr', '')}"
+                    f"Error durante el rebase: {rebase_result.stderr}"
                 )
 
             self.git_logger.log_rebase_operation(
@@ -117,9 +109,12 @@ class GitRebaseManager:
         """Cancela un rebase en progreso"""
         self.git.ask_pass()
 
-        abort_result = self.git.run_git_command("git rebase --abort", allow_failure=True)
+        # Sin rebase-merge ni rebase-apply en .git no hay nada que cancelar
+        abort_result = None
+        if self.git.is_operation_in_progress("rebase"):
+            abort_result = self.git.run_git_command_check("git rebase --abort", allow_failure=True)
 
-        if abort_result["returncode"] == 0:
+        if abort_result is not None and abort_result.returncode == 0:
             self.colors.success("Rebase cancelado exitosamente.")
             self.git_logger.log_operation(
                 "REBASE_CANCEL", "Rebase cancelado", "SUCCESS"
@@ -132,8 +127,16 @@ class GitRebaseManager:
         self.git.ask_pass()
 
         try:
-            current_result = self.git.run_git_command("git branch --show-current")
-            current_branch = current_result["stdout"].strip()
+            # Rama actual, cambios locales y existencia de la base en un solo proceso
+            current_branch, status_output, base_sha = self.git.run_git_batch(
+                [
+                    "git symbolic-ref --short -q HEAD",
+                    "git status --porcelain",
+                    "git rev-parse --verify --quiet "
+                    + self.git.quote_arg(f"refs/heads/{self.base_branch}"),
+                ]
+            )
+            self.git.current_branch = current_branch
 
             self.colors.info(f"\n ACTUALIZANDO RAMA BASE:")
             self.colors.info(f" Repo: {Fore.MAGENTA}{self.git.repo_path}{Fore.RESET}")
@@ -144,50 +147,42 @@ class GitRebaseManager:
                 f" Actualizando: {Fore.BLUE}{self.base_branch}{Fore.RESET}"
             )
 
-            status = self.git.run_git_command("git status --porcelain", allow_failure=True)
-            has_local_changes = bool(status["stdout"].strip())
+            has_local_changes = bool(status_output)
 
             if has_local_changes:
                 self.colors.warning("Hay cambios locales sin commitear.")
                 if self.git.confirm_action("¿Guardar cambios antes de actualizar la base?"):
-                    from src.git.managers.GitStashManager import GitStashManager
-                    stash_manager = GitStashManager(self.git)
-                    stash_manager.save_changes_locally()
+                    self.git.stash_manager.save_changes_locally()
 
-            base_check = self.git.run_git_command(
-                f"git rev-parse --verify {self.base_branch}", allow_failure=True
-            )
+            # Un solo fetch al inicio; lo demás se resuelve con las referencias locales
+            self.colors.info("📡 Actualizando referencias remotas...")
+            self.git.run_git_command_check("git fetch origin")
 
-            if base_check["returncode"] != 0:
+            if not base_sha:
                 self.colors.warning(
-                    f"Descargando rama base '{self.base_branch}' desde remoto..."
-                )
-                self.git.run_git_command(
-                    f"git fetch origin {self.base_branch}:{self.base_branch}"
+                    f"La rama base '{self.base_branch}' se creará desde origin/{self.base_branch}"
                 )
 
+            # Si la rama local no existe, checkout la crea a partir de origin/<base>
             self.colors.info(f" Cambiando a {self.base_branch}...")
-            checkout_result = self.git.run_git_command(
-                f"git checkout {self.base_branch}", allow_failure=True
+            checkout_result = self.git.run_git_command_check(
+                ["git", "checkout", self.base_branch], allow_failure=True
             )
 
-            if checkout_result["returncode"] != 0:
+            if checkout_result.returncode != 0:
                 self.colors.error(f"Error al cambiar a la rama {self.base_branch}")
                 return
 
-            self.colors.info("📡 Actualizando referencias remotas...")
-            self.git.run_git_command("git fetch origin")
-
             self.colors.info(f" Descargando últimos cambios de {self.base_branch}...")
 
             ahead_result = self.git.run_git_command(
-                f"git rev-list --count origin/{self.base_branch}..HEAD",
+                ["git", "rev-list", "--count", f"origin/{self.base_branch}..HEAD"],
                 allow_failure=True,
             )
 
             has_local_commits = False
-            if ahead_result["returncode"] == 0:
-                ahead_count = int(ahead_result["stdout"].strip() or 0)
+            if ahead_result.returncode == 0:
+                ahead_count = int(ahead_result.stdout.strip() or 0)
                 has_local_commits = ahead_count > 0
 
             if has_local_commits:
@@ -197,15 +192,29 @@ class GitRebaseManager:
                 if self.git.confirm_action(
                     f"¿Hacer reset hard a origin/{self.base_branch}? (Se perderán los commits locales)"
                 ):
-                    self.git.run_git_command(f"git reset --hard origin/{self.base_branch}")
+                    self.git.run_git_command_check(
+                        ["git", "reset", "--hard", f"origin/{self.base_branch}"]
+                    )
                     self.colors.success(
                         f"Rama {self.base_branch} reseteada a la versión remota."
                     )
                 else:
-                    merge_result = self.git.run_git_command(
-                        f"git merge origin/{self.base_branch}", allow_failure=True
+                    # Se simula el merge antes para no dejar la rama a medias por
+                    # conflictos (merge-tree --write-tree requiere Git 2.38; con
+                    # versiones anteriores se hace el merge directamente)
+                    preview = self.git.preview_merge("HEAD", f"origin/{self.base_branch}")
+                    if preview is not None and preview[1]:
+                        self.colors.error(
+                            "El merge tendría conflictos en: " + ", ".join(preview[1])
+                        )
+                        self.colors.info(" Resuelve los conflictos manualmente.")
+                        return
+
+                    merge_result = self.git.run_git_command_check(
+                        ["git", "merge", f"origin/{self.base_branch}"],
+                        allow_failure=True,
                     )
-                    if merge_result["returncode"] == 0:
+                    if merge_result.returncode == 0:
                         self.colors.success(f"Merge exitoso en {self.base_branch}.")
                     else:
                         self.colors.error(
@@ -213,7 +222,9 @@ class GitRebaseManager:
                         )
                         return
             else:
-                self.git.run_git_command(f"git reset --hard origin/{self.base_branch}")
+                self.git.run_git_command_check(
+                    ["git", "reset", "--hard", f"origin/{self.base_branch}"]
+                )
                 self.colors.success(
                     f"Rama {self.base_branch} actualizada exitosamente."
                 )
@@ -221,25 +232,23 @@ class GitRebaseManager:
             last_commit = self.git.run_git_command(
                 "git log -1 --oneline", allow_failure=True
             )
-            if last_commit["stdout"]:
-                self.colors.info(f" Último commit: {last_commit['stdout'].strip()}")
+            if last_commit.stdout:
+                self.colors.info(f" Último commit: {last_commit.stdout.strip()}")
 
             if current_branch != self.base_branch:
                 self.colors.info(f" Regresando a {current_branch}...")
-                return_result = self.git.run_git_command(
-                    f"git checkout {current_branch}", allow_failure=True
+                return_result = self.git.run_git_command_check(
+                    ["git", "checkout", current_branch], allow_failure=True
                 )
 
-                if return_result["returncode"] == 0:
+                if return_result.returncode == 0:
                     self.colors.success(
                         f"De vuelta en: {Fore.YELLOW}{current_branch}{Fore.RESET}"
                     )
 
                     if has_local_changes:
                         if self.git.confirm_action("¿Restaurar los cambios guardados?"):
-                            from src.git.managers.GitStashManager import GitStashManager
-                            stash_manager = GitStashManager(self.git)
-                            stash_manager.restore_local_changes()
+                            self.git.stash_manager.restore_local_changes()
                 else:
                     self.colors.error(f"Error al regresar a {current_branch}")
 
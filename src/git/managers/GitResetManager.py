@@ -19,8 +19,7 @@ class GitResetManager:
         self.git.ask_pass()
 
         try:
-            current = self.git.run_git_command("git branch --show-current")
-            current_branch = current["stdout"].strip()
+            current_branch = self.git.get_current_branch_name()
 
             self.colors.info(f"\n RESET COMPLETO A RAMA BASE:")
             self.colors.info(f" Repo: {Fore.MAGENTA}{self.git.repo_path}{Fore.RESET}")
@@ -31,12 +30,12 @@ class GitResetManager:
                 f" Resetear a: {Fore.BLUE}{self.base_branch}{Fore.RESET}"
             )
 
-            status = self.git.run_git_command("git status --porcelain")
-            has_changes = bool(status["stdout"].strip())
+            status_entries = self.git.get_status()
+            has_changes = bool(status_entries)
 
             if has_changes:
                 self.colors.info(" Cambios detectados:")
-                self.git.run_git_command("git status --short")
+                self.colors.block(f"{self.git.format_status_short(status_entries)}\n")
 
             if not self.git.confirm_action(
                 f"ADVERTENCIA: Esta operación borrará TODOS tus cambios actuales.\n"
@@ -69,7 +68,7 @@ class GitResetManager:
             )
 
             self.colors.info("\n📊 Estado final:")
-            self.git.run_git_command("git status")
+            self.git.run_git_command_stream(["git", "status"])
 
         except Exception as e:
             self.colors.error(f"Error durante reset: {str(e)}")
@@ -80,64 +79,43 @@ class GitResetManager:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_branch = f"{self.feature_branch}_backup_{timestamp}"
 
+        backup_sha = ""
         if has_changes:
             self.colors.info("💾 Guardando cambios no commiteados...")
-            stash_msg = f"Backup antes de reset - {timestamp}"
-            self.git.run_git_command(f'git stash push -m "{stash_msg}"')
+            # Se agregan los archivos nuevos para que también queden en el backup
+            self.git.run_git_command_check(["git", "add", "-A"])
+            commit_msg = f"Backup de cambios antes de reset - {timestamp}"
+            # write-tree toma el índice ya preparado y commit-tree crea el commit
+            # sobre HEAD sin tocar el árbol de trabajo; el reset posterior lo limpia
+            tree_sha = self.git.run_git_command(["git", "write-tree"]).stdout
+            backup_sha = self.git.run_git_command(
+                ["git", "commit-tree", tree_sha, "-p", "HEAD", "-m", commit_msg]
+            ).stdout
 
         self.colors.info(f" Creando rama de backup: {backup_branch}")
-        self.git.run_git_command(f"git checkout -b {backup_branch}")
-
-        if has_changes:
-            self.colors.info(" Aplicando cambios guardados...")
-            self.git.run_git_command("git stash pop")
-            self.git.run_git_command("git add .")
-            commit_msg = f"Backup de cambios antes de reset - {timestamp}"
-            self.git.run_git_command(f'git commit -m "{commit_msg}"')
+        self.git.run_git_command_check(
+            ["git", "update-ref", f"refs/heads/{backup_branch}", backup_sha or "HEAD"]
+        )
 
         self.colors.warning(f"El backup '{backup_branch}' es solo local.")
         return backup_branch
 
     def _reset_to_base(self) -> None:
         """Resetea la rama feature a la rama base de forma forzada"""
-        base_check = self.git.run_git_command(
-            f"git rev-parse --verify {self.base_branch}", allow_failure=True
-        )
-
-        if base_check["returncode"] != 0:
-            self.colors.warning(f"Descargando rama base '{self.base_branch}'...")
-            self.git.run_git_command(
-                f"git fetch origin {self.base_branch}:{self.base_branch}"
-            )
-
+        # Un solo fetch; si la rama base no existe, checkout la crea desde origin/<base>
         self.colors.info(f" Actualizando {self.base_branch}...")
-        self.git.run_git_command(f"git checkout {self.base_branch}")
-        self.git.run_git_command("git fetch origin")
-        self.git.run_git_command(f"git reset --hard origin/{self.base_branch}")
+        self.git.run_git_command_check("git fetch origin")
 
-        self.colors.info(f" Reseteando {self.feature_branch}...")
+        base = self.git.quote_arg(self.base_branch)
+        remote_base = self.git.quote_arg(f"origin/{self.base_branch}")
+        feature = self.git.quote_arg(self.feature_branch)
 
-        feature_exists = self.git.run_git_command(
-            f"git rev-parse --verify {self.feature_branch}", allow_failure=True
+        # branch -f crea o mueve la rama feature a la base sin importar si existe,
+        # y checkout -f descarta los cambios locales al cambiar de rama
+        self.colors.info(f" Reseteando {self.feature_branch}...")
+        self.colors.info("🗑️ Descartando TODOS los cambios locales...")
+        self.git.run_git_command_check(
+            f"git checkout -f {base} && git reset --hard {remote_base}"
+            f" && git branch -f {feature} {base} && git checkout -f {feature}"
+            f" && git clean -fd"
         )
-
-        if feature_exists["returncode"] == 0:
-            self.colors.info("🗑️ Descartando TODOS los cambios locales...")
-            
-            self.git.run_git_command("git clean -fd")
-            self.git.run_git_command("git reset --hard HEAD")
-            self.git.run_git_command("git stash clear", allow_failure=True)
-            
-            checkout_result = self.git.run_git_command(f"git checkout -f {self.feature_branch}", allow_failure=True)
-            
-            if checkout_result["returncode"] != 0:
-                self.colors.warning("Recreando rama feature desde cero...")
-                self.git.run_git_command(f"git branch -D {self.feature_branch}", allow_failure=True)
-                self.git.run_git_command(f"git checkout -b {self.feature_branch}")
-            else:
-                self.git.run_git_command(f"git reset --hard {self.base_branch}")
-        else:
-            self.git.run_git_command(f"git checkout -b {self.feature_branch}")
-        
-        self.colors.info("🧹 Limpieza final...")
-        self.git.run_git_command("git clean -fd")
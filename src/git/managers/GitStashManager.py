@@ -12,13 +12,14 @@ class GitStashManager:
 
     def save_changes_locally(self) -> None:
         """Guarda los cambios locales usando stash"""
-        status = self.git.run_git_command("git status --porcelain", allow_failure=True)
-        if not status["stdout"].strip():
+        # Un solo git status sirve para saber si hay cambios y para mostrarlos
+        status_entries = self.git.get_status()
+        if not status_entries:
             self.colors.warning(" No hay cambios locales para guardar.")
             return
 
         self.colors.info(" Cambios que se guardarán:")
-        self.git.run_git_command("git status --short")
+        self.colors.block(f"{self.git.format_status_short(status_entries)}\n")
 
         stash_message = input(" Escribe el mensaje del stash: ").strip()
         if not stash_message:
@@ -28,27 +29,33 @@ class GitStashManager:
 
         self.git_logger.log_user_input("stash_message", stash_message)
 
-        self.git.run_git_command(f'git stash push -m "{stash_message}"')
+        self.git.run_git_command_check(["git", "stash", "push", "-m", stash_message])
         self.colors.success(" Cambios guardados localmente con stash.")
         self.git_logger.log_stash_operation("save", stash_message, "SUCCESS")
 
     def restore_local_changes(self) -> None:
         """Restaura los cambios guardados con stash"""
-        result = self.git.run_git_command("git stash list", allow_failure=True)
-
-        if not result["stdout"].strip():
+        if not self.git.has_stashes():
             self.colors.warning(" No hay stash para aplicar.")
             return
 
+        # Solo los archivos; el diff completo se muestra si el usuario lo pide
         self.colors.info(" Último stash:")
-        self.git.run_git_command("git stash show -p stash@{0}")
+        self.git.run_git_command_stream(
+            ["git", "--no-pager", "stash", "show", "--name-status", "stash@{0}"]
+        )
+
+        if self.git.confirm_action("¿Mostrar diff completo?"):
+            self.git.run_git_command_stream(
+                ["git", "--no-pager", "stash", "show", "-p", "stash@{0}"]
+            )
 
         if not self.git.confirm_action("¿Deseas aplicar este stash?"):
             return
 
-        stash_result = self.git.run_git_command("git stash pop", allow_failure=True)
+        stash_result = self.git.run_git_command_check("git stash pop", allow_failure=True)
 
-        if stash_result["returncode"] == 0:
+        if stash_result.returncode == 0:
             self.colors.success("Cambios locales restaurados.")
             self.git_logger.log_stash_operation("pop", "", "SUCCESS")
         else:
@@ -1,7 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Set, Tuple
 from colorama import Fore
 from src.consts.env import GIT_CONFIG_ID
 
 
+# Paso del flujo: (encabezado, comando, mensaje de éxito, mensaje de error)
+WorkflowStep = Tuple[str, str, str, str]
+
+# Línea que imprime el pull de develop del paso 4 cuando falla (no es fatal)
+_PULL_WARNING = "__PULL_WARNING__"
+
+# Línea que imprime el paso del commit cuando no hay nada preparado (no es fatal)
+_NOTHING_TO_COMMIT = "__NOTHING_TO_COMMIT__"
+
+
 class GitWorkflowManager:
     """Clase para manejar flujos complejos de Git (GitFlow, etc)"""
 
@@ -14,6 +26,61 @@ class GitWorkflowManager:
         self.base_branch = git_instance.base_branch
         self.feature_branch = git_instance.feature_branch
 
+    def _run_workflow_steps(self, steps: List["WorkflowStep"]) -> bool:
+        """
+        Ejecuta los pasos del flujo encadenados con && en un solo proceso,
+        mostrando su salida según avanza; los marcadores __STEP_N__ indican
+        qué paso está en curso y no se muestran
+
+        Returns:
+            True si todos los pasos terminaron correctamente
+        """
+        chain = " && ".join(
+            f"echo __STEP_{index}__ && {step[1]}" for index, step in enumerate(steps)
+        )
+        step_markers = {f"__STEP_{index}__": index for index in range(len(steps))}
+        current_step: List[int] = []
+        skipped_success: Set[int] = set()
+
+        def finish_step(index: int) -> None:
+            success_message = steps[index][2]
+            if success_message and index not in skipped_success:
+                self.colors.success(success_message)
+
+        def handle_line(line: str) -> None:
+            # cmd.exe deja un espacio tras el echo, por eso se comparan sin espacios
+            marker = line.strip()
+            if marker in step_markers:
+                if current_step:
+                    finish_step(current_step[-1])
+                index = step_markers[marker]
+                current_step.append(index)
+                if steps[index][0]:
+                    self.colors.info(steps[index][0])
+            elif marker == _PULL_WARNING:
+                self.colors.warning("Advertencia al actualizar develop")
+            elif marker == _NOTHING_TO_COMMIT:
+                if current_step:
+                    skipped_success.add(current_step[-1])
+                self.colors.warning("No hay cambios nuevos para commitear")
+            else:
+                self.colors.block(f"{line}\n")
+
+        returncode = self.git.run_git_command_stream(chain, line_handler=handle_line)
+
+        if returncode != 0:
+            failed_step = current_step[-1] if current_step else 0
+            self.colors.error(steps[failed_step][3])
+            return False
+
+        if current_step:
+            finish_step(current_step[-1])
+        return True
+
+    def _ask_yes_no(self, prompt: str) -> bool:
+        """Pide una respuesta s/N al usuario"""
+        return input(prompt).strip().lower() in ["s", "si", "sí", "y", "yes"]
+
     def feature_branch_workflow(self):
         """Flujo completo de feature branch según GitFlow CONACYT - Arquitectura GitFlow"""
         self.git.ask_pass()
@@ -37,6 +104,15 @@ class GitWorkflowManager:
             self.colors.info("Operación cancelada.")
             return
 
+        # La consulta al remoto corre en segundo plano mientras se piden los datos;
+        # no escribe en la terminal ni puede pedir credenciales (si las necesita,
+        # falla y el flujo hace el pull de develop como siempre)
+        executor = ThreadPoolExecutor(max_workers=1)
+        remote_develop_future = executor.submit(
+            self.git.remote_head_sha, "develop", background=True
+        )
+        executor.shutdown(wait=False)
+
         version = input("Ingresa la versión (ej: [N].[N].[N]): ").strip()
         if not version:
             self.colors.error("La versión es requerida")
@@ -49,6 +125,12 @@ class GitWorkflowManager:
 
         feature_name = f"feature/version-{version.replace('.', '-')}"
 
+        # Las preferencias de limpieza se piden antes para no frenar el flujo al final
+        delete_local = self._ask_yes_no("¿Eliminar la rama feature local al terminar? (s/N): ")
+        delete_remote = delete_local and self._ask_yes_no(
+            "¿Eliminar también del remoto? (s/N): "
+        )
+
         self.git_logger.log_user_input("version", version)
         self.git_logger.log_user_input("commit_message", message)
         self.git_logger.log_user_input("feature_name", feature_name)
@@ -58,142 +140,112 @@ class GitWorkflowManager:
         )
 
         try:
-            self.colors.info("\n📍 PASO 1: Actualizando rama develop...")
-
-            checkout_result = self.git.run_git_command(
-                "git checkout develop", allow_failure=True
-            )
-            if checkout_result["returncode"] != 0:
-                self.colors.error("Error al cambiar a develop")
-                return
-
-            pull_result = self.git.run_git_command(
-                "git pull origin develop", allow_failure=True
-            )
-            if pull_result[
-                "returncode"
-            ] != 0 and "Already up to date" not in pull_result.get("stdout", ""):
-                self.colors.error("Error al actualizar develop")
-                return
+            # Las comprobaciones previas se hacen antes de encadenar los pasos
+            feature_exists = self.git.verify_ref(feature_name) is not None
+            status_entries = self.git.get_status()
+            has_changes = bool(status_entries)
 
-            self.colors.info(
-                f"\n PASO 2: Creando rama {Fore.YELLOW}{feature_name}{Fore.RESET}..."
-            )
-
-            exists = self.git.run_git_command(
-                f"git rev-parse --verify {feature_name}", allow_failure=True
-            )
-            if exists["returncode"] == 0:
-                self.colors.warning(f"La rama {feature_name} ya existe")
-                self.git.run_git_command(f"git checkout {feature_name}")
+            if has_changes:
+                self.colors.info(" Cambios detectados:")
+                self.colors.block(f"{self.git.format_status_short(status_entries)}\n")
             else:
-                create_result = self.git.run_git_command(
-                    f"git checkout -b {feature_name}", allow_failure=True
-                )
-                if create_result["returncode"] != 0:
-                    self.colors.error(f"Error al crear la rama {feature_name}")
-                    return
-
-            self.colors.info("\n💾 PASO 3: Realizando cambios y commit...")
-
-            status = self.git.run_git_command("git status --porcelain", allow_failure=True)
-            if not status["stdout"].strip():
                 self.colors.warning("No hay cambios para commitear")
                 if not self.git.confirm_action("¿Continuar sin cambios?"):
                     return
-            else:
-                self.colors.info(" Cambios detectados:")
-                self.git.run_git_command("git status --short")
-
-                self.colors.info("▶ Ejecutando: git add .")
-                add_result = self.git.run_git_command("git add .", allow_failure=True)
-                if add_result["returncode"] != 0:
-                    self.colors.error("Error al añadir cambios")
-                    return
 
-                self.colors.info(f"▶ Ejecutando: git commit -m '{message}'")
-                commit_result = self.git.run_git_command(
-                    f'git commit -m "{message}"', allow_failure=True
-                )
-                if commit_result["returncode"] != 0:
-                    if "nothing to commit" in commit_result.get("stdout", ""):
-                        self.colors.warning("No hay cambios nuevos para commitear")
-                    else:
-                        self.colors.error("Error al hacer commit")
-                        return
-                else:
-                    self.colors.success("Commit realizado exitosamente")
-
-            self.colors.info("\n PASO 4: Volviendo a develop y actualizando...")
-
-            checkout_dev = self.git.run_git_command(
-                "git checkout develop", allow_failure=True
+            # Si develop local ya apunta al mismo commit que el remoto, los pull sobran
+            remote_develop = remote_develop_future.result()
+            develop_up_to_date = remote_develop is not None and (
+                remote_develop == self.git.verify_ref("refs/heads/develop")
             )
-            if checkout_dev["returncode"] != 0:
-                self.colors.error("Error al cambiar a develop")
+            if develop_up_to_date:
+                self.colors.info("develop ya está actualizado con origin/develop")
+
+            quoted_feature = self.git.quote_arg(feature_name)
+            steps: List[WorkflowStep] = [
+                (
+                    "\n📍 PASO 1: Actualizando rama develop...",
+                    "git checkout develop",
+                    "",
+                    "Error al cambiar a develop",
+                ),
+            ]
+            if not develop_up_to_date:
+                steps.append(("", "git pull origin develop", "", "Error al actualizar develop"))
+            steps += [
+                (
+                    f"\n PASO 2: Creando rama {Fore.YELLOW}{feature_name}{Fore.RESET}...",
+                    f"git checkout {quoted_feature}"
+                    if feature_exists
+                    else f"git checkout -b {quoted_feature}",
+                    "",
+                    f"Error al crear la rama {feature_name}",
+                ),
+            ]
+            if has_changes:
+                steps += [
+                    (
+                        "\n💾 PASO 3: Realizando cambios y commit...",
+                        "git add .",
+                        "",
+                        "Error al añadir cambios",
+                    ),
+                    (
+                        "",
+                        # Sin cambios preparados solo se avisa, como antes, y el flujo sigue
+                        f"(git diff --cached --quiet && echo {_NOTHING_TO_COMMIT}"
+                        f" || git commit -m {self.git.quote_arg(message)})",
+                        "Commit realizado exitosamente",
+                        "Error al hacer commit",
+                    ),
+                ]
+            steps += [
+                (
+                    "\n PASO 4: Volviendo a develop y actualizando...",
+                    "git checkout develop",
+                    "",
+                    "Error al cambiar a develop",
+                ),
+            ]
+            if not develop_up_to_date:
+                # Un fallo al actualizar develop solo se avisa, no detiene el flujo
+                steps.append(("", f"(git pull origin develop || echo {_PULL_WARNING})", "", ""))
+            steps += [
+                (
+                    f"Haciendo merge de {Fore.YELLOW}{feature_name}{Fore.RESET}...",
+                    f"git merge {quoted_feature}",
+                    "Merge completado",
+                    f"Error al hacer merge de {feature_name}",
+                ),
+                (
+                    "\n⬆PASO 5: Subiendo cambios a develop...",
+                    "git push origin develop",
+                    "Cambios subidos exitosamente a develop",
+                    "Error al subir cambios a develop\n Intenta: git push origin develop",
+                ),
+            ]
+
+            if not self._run_workflow_steps(steps):
                 return
 
-            pull_dev = self.git.run_git_command(
-                "git pull origin develop", allow_failure=True
-            )
-            if pull_dev["returncode"] != 0 and "Already up to date" not in pull_dev.get(
-                "stdout", ""
-            ):
-                self.colors.warning("Advertencia al actualizar develop")
-
-            self.colors.info(
-                f"Haciendo merge de {Fore.YELLOW}{feature_name}{Fore.RESET}..."
-            )
-            merge_result = self.git.run_git_command(
-                f"git merge {feature_name}", allow_failure=True
-            )
-
-            if merge_result["returncode"] != 0:
-                if "Already up to date" in merge_result.get("stdout", ""):
-                    self.colors.info("Ya está actualizado")
-                else:
-                    self.colors.error(f"Error al hacer merge de {feature_name}")
-                    return
-            else:
-                self.colors.success("Merge completado")
-
-            self.colors.info("\n⬆PASO 5: Subiendo cambios a develop...")
-            push_result = self.git.run_git_command(
-                "git push origin develop", allow_failure=True
-            )
-
-            if push_result["returncode"] != 0:
-                if "Everything up-to-date" in push_result.get("stdout", ""):
-                    self.colors.info("Todo está actualizado")
-                else:
-                    self.colors.error("Error al subir cambios a develop")
-                    self.colors.info(" Intenta: git push origin develop")
-                    return
-            else:
-                self.colors.success("Cambios subidos exitosamente a develop")
-
-            self.colors.info("\n🧹 PASO 6: Limpieza opcional...")
-            cleanup = input("¿Eliminar la rama feature local? (s/N): ").strip().lower()
-
-            if cleanup in ["s", "si", "sí", "y", "yes"]:
-                delete_local = self.git.run_git_command(
-                    f"git branch -d {feature_name}", allow_failure=True
+            if delete_local:
+                self.colors.info("\n🧹 PASO 6: Limpieza...")
+                delete_local_result = self.git.run_git_command_check(
+                    ["git", "branch", "-d", feature_name], allow_failure=True
                 )
-                if delete_local["returncode"] == 0:
+                if delete_local_result.returncode == 0:
                     self.colors.success(f"Rama local {feature_name} eliminada")
                 else:
-                    self.git.run_git_command(
-                        f"git branch -D {feature_name}", allow_failure=True
+                    self.git.run_git_command_check(
+                        ["git", "branch", "-D", feature_name], allow_failure=True
                     )
 
-                remote_delete = (
-                    input("¿Eliminar también del remoto? (s/N): ").strip().lower()
-                )
-                if remote_delete in ["s", "si", "sí", "y", "yes"]:
-                    delete_remote = self.git.run_git_command(
-                        f"git push origin --delete {feature_name}", allow_failure=True
+                if delete_remote:
+                    delete_remote_result = self.git.run_git_command_check(
+                        ["git", "push", "origin", f":refs/heads/{feature_name}"],
+                        allow_failure=True,
                     )
-                    if delete_remote["returncode"] == 0:
+                    if delete_remote_result.returncode == 0:
                         self.colors.success(f"Rama remota {feature_name} eliminada")
 
             self.colors.success("\n" + "=" * 60)
@@ -208,7 +260,7 @@ class GitWorkflowManager:
             self.colors.info(f"   ✓ Subido a: {Fore.GREEN}origin/develop{Fore.RESET}")
 
             self.colors.info("\n📊 Estado final:")
-            self.git.run_git_command("git status")
+            self.git.run_git_command_stream(["git", "status"])
 
             self.git_logger.log_operation(
                 "FEATURE_BRANCH_WORKFLOW",
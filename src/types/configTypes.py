@@ -1,88 +1,178 @@
 # Tipos
 
-from typing import TypedDict, Optional, Callable, Protocol, Literal, List, Dict
-
-
-# Protocolo para el logger
-class LoggerProtocol(Protocol):
-    def log_user_input(self, input_type: str, value: str) -> None: ...
-    def log_warning(self, warning_message: str, context: str = "") -> None: ...
-    def log_success(self, success_message: str, context: str = "") -> None: ...
-    def log_error(self, error_message: str, context: str = "") -> None: ...
-    def log_program_end(self) -> None: ...
-    def log_menu_selection(self, option_number: int, option_description: str) -> None: ...
-    def log_operation(self, operation: str, details: str = "", status: "LogStatus" = "INFO") -> None: ...
-    def log_git_command(self, command: str, result: "GitCommandResult") -> None: ...
-    def log_branch_operation(self, operation: str, branch_name: str, details: str = "") -> None: ...
-    def log_rebase_operation(self, base_branch: str, feature_branch: str, status: "LogStatus" = "INFO") -> None: ...
-    def log_pull_operation(self, branch_name: str, status: "LogStatus" = "INFO") -> None: ...
-    def log_push_operation(self, branch_name: str, commit_message: str, status: "LogStatus" = "INFO") -> None: ...
-    def log_stash_operation(self, operation: str, stash_message: str = "", status: "LogStatus" = "INFO") -> None: ...
-    def log_program_start(self, config: "ExtendedConfigType") -> None: ...
-    def read_today_log(self) -> str: ...
-    def get_today_log_path(self) -> str: ...
-
-
-# Tipo para las configuraciones base
-class ConfigType(TypedDict):
+import sys
+from dataclasses import MISSING, dataclass, fields
+from functools import lru_cache
+from typing import TYPE_CHECKING, TypedDict, NamedTuple, Optional, Callable, Literal, List, Dict, Tuple, Any, Type, TypeVar, cast
+
+
+# Protocolo para el logger (solo para el chequeo de tipos, no se crea en tiempo de ejecución)
+if TYPE_CHECKING:
+    from typing import Protocol
+
+    class LoggerProtocol(Protocol):
+        def log_user_input(self, input_type: str, value: str) -> None: ...
+        def log_warning(self, warning_message: str, context: str = "") -> None: ...
+        def log_success(self, success_message: str, context: str = "") -> None: ...
+        def log_error(self, error_message: str, context: str = "") -> None: ...
+        def log_program_end(self) -> None: ...
+        def log_menu_selection(self, option_number: int, option_description: str) -> None: ...
+        def log_operation(self, operation: str, details: str = "", status: "LogStatus" = "INFO") -> None: ...
+        def log_operation_info(self, operation: str, details: str = "") -> None: ...
+        def log_git_command(self, command: str, result: "GitCommandResult") -> None: ...
+        def log_branch_operation(self, operation: str, branch_name: str, details: str = "") -> None: ...
+        def log_rebase_operation(self, base_branch: str, feature_branch: str, status: "LogStatus" = "INFO") -> None: ...
+        def log_pull_operation(self, branch_name: str, status: "LogStatus" = "INFO") -> None: ...
+        def log_push_operation(self, branch_name: str, commit_message: str, status: "LogStatus" = "INFO") -> None: ...
+        def log_stash_operation(self, operation: str, stash_message: str = "", status: "LogStatus" = "INFO") -> None: ...
+        def log_program_start(self, config: "ExtendedConfigType") -> None: ...
+        def read_today_log(self) -> str: ...
+        def get_today_log_path(self) -> str: ...
+
+
+# Tipo genérico para las clases de configuración (usado por from_dict)
+ConfigT = TypeVar("ConfigT", bound="ConfigFromDict")
+
+
+# Genera (una vez por clase) un from_dict especializado con los campos fijos de la clase
+@lru_cache(maxsize=None)
+def compile_from_dict(config_class: type) -> Callable[[Dict[str, Any]], Any]:
+    namespace: Dict[str, Any] = {"config_class": config_class}
+    arguments: List[str] = []
+    for config_field in fields(config_class):
+        name = config_field.name
+        if config_field.default is not MISSING:
+            # Los campos opcionales usan su valor por defecto si no vienen en el diccionario
+            namespace[f"default_{name}"] = config_field.default
+            arguments.append(f"{name}=data.get({name!r}, default_{name})")
+        elif config_field.default_factory is not MISSING:
+            namespace[f"factory_{name}"] = config_field.default_factory
+            arguments.append(
+                f"{name}=data[{name!r}] if {name!r} in data else factory_{name}()"
+            )
+        else:
+            arguments.append(f"{name}=data[{name!r}]")
+    source = (
+        f"def from_dict_{config_class.__name__}(data):\n"
+        f"    return config_class({', '.join(arguments)})\n"
+    )
+    exec(source, namespace)
+    return namespace[f"from_dict_{config_class.__name__}"]
+
+
+# Base para las clases de configuración que se crean desde un diccionario
+class ConfigFromDict:
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls: Type[ConfigT], data: Dict[str, Any]) -> ConfigT:
+        """Crea la configuración ignorando las claves que no son campos"""
+        return compile_from_dict(cls)(data)
+
+
+# Tipo para la configuración completa (un solo esquema plano con todos los campos)
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ExtendedConfigType(ConfigFromDict):
     number: int
-    id: str
-    name: str
-    email: str
-    username: str
-    token: str
-    branch: str
-
-
-# Tipo para las configuraciones con ruta completa del repositorio
-class ConfigWithPathType(ConfigType):
+    id: str = ""
+    name: str = ""
+    email: str = ""
+    username: str = ""
+    token: str = ""
+    branch: str = ""
     repo_path: str
-
-
-# Tipo para configuraciones extendidas con campos opcionales
-class ExtendedConfigType(ConfigWithPathType, total=False):
-    base_branch: str
-    feature_branch: Optional[str]
-    project: Optional[str]
-    section: Optional[str]
+    base_branch: str = ""
+    feature_branch: Optional[str] = None
+    project: Optional[str] = None
+    section: Optional[str] = None
+    task: Optional[str] = None
+
+
+# Nombres anteriores de las configuraciones base y con ruta; apuntan al esquema plano
+ConfigType = ExtendedConfigType
+ConfigWithPathType = ExtendedConfigType
+
+
+# Tipo para una configuración tal como aparece en una sección del archivo JSON
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ConfigRecord(ConfigFromDict):
+    id: str = ""
+    name: str = ""
+    email: str = ""
+    username: str = ""
+    token: str = ""
+    branch: str = ""
+    task: Optional[str] = None
+    base_branch: str = ""
+    feature_branch: Optional[str] = None
+    repo_path: Optional[str] = None
+    project: Optional[str] = None
+    name_folder: Optional[str] = None
 
 
 # Tipo para secciones de configuración
 class ConfigSection(TypedDict, total=False):
     description: str
     repo_path: Optional[str]
-    configs: List[Dict]
+    configs: List[ConfigRecord]
 
 
 # Tipo para configuraciones opcionales durante la carga
 class PartialConfigType(TypedDict, total=False):
-    number: Optional[int]
-    id: Optional[str]
-    name: Optional[str]
-    email: Optional[str]
-    username: Optional[str]
-    token: Optional[str]
-    repo: Optional[str]
-    branch: Optional[str]
-    repo_path: Optional[str]
+    number: int
+    id: str
+    name: str
+    email: str
+    username: str
+    token: str
+    repo: str
+    branch: str
+    repo_path: str
     base_branch: str
-    feature_branch: Optional[str]
-    project: Optional[str]
-    section: Optional[str]
+    feature_branch: str
+    project: str
+    section: str
+    task: str
 
 
 # Tipo para las opciones del menú
-class MenuOptionType(TypedDict):
+class MenuOption(NamedTuple):
     function: Callable[[], None]
     description: str
 
 
-# Tipo para el resultado de comandos Git
-class GitCommandResult(TypedDict):
+# Alias del nombre anterior de las opciones del menú (solo para el chequeo de tipos)
+if TYPE_CHECKING:
+    MenuOptionType = MenuOption
+
+
+# Tipo para el resultado de comandos Git (tupla con nombre, acceso por atributo)
+class GitCommandResult(NamedTuple):
     returncode: int
     stdout: str
     stderr: str
 
 
+# Tipo para el estado de la rama según git status --porcelain=v2 --branch
+class BranchStatusType(TypedDict):
+    branch: str
+    upstream: Optional[str]
+    ahead: int
+    behind: int
+    paths: List[str]
+    unstaged: List[str]
+
+
+# Tipo para una entrada de git status: (XY al estilo porcelain v1, ruta)
+StatusEntryType = Tuple[str, str]
+
+
 # Tipos literales para los status de log
 LogStatus = Literal["INFO", "SUCCESS", "WARNING", "ERROR"]
+
+
+# Constantes (internadas) de los status de log para no repetir literales
+LOG_INFO: LogStatus = cast(LogStatus, sys.intern("INFO"))
+LOG_SUCCESS: LogStatus = cast(LogStatus, sys.intern("SUCCESS"))
+LOG_WARNING: LogStatus = cast(LogStatus, sys.intern("WARNING"))
+LOG_ERROR: LogStatus = cast(LogStatus, sys.intern("ERROR"))
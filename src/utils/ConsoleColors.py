@@ -1,3 +1,4 @@
+import sys
 from colorama import init, Fore, Style
 
 
@@ -22,3 +23,12 @@ class ConsoleColors:
     # Función para imprimir un mensaje de información
     def info(self, message: str) -> None:
         print(Fore.CYAN + "ℹ " + message + Style.RESET_ALL)
+
+    # Función para dar formato de información a una línea sin imprimirla
+    def info_line(self, message: str) -> str:
+        return Fore.CYAN + "ℹ " + message + Style.RESET_ALL + "\n"
+
+    # Función para imprimir un bloque de texto ya formateado en una sola escritura
+    def block(self, text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()